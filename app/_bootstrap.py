@@ -0,0 +1,15 @@
+"""Put the project's import roots on sys.path once per process."""
+
+import sys
+from pathlib import Path
+
+_APP_DIR = Path(__file__).parent
+_PROJECT_ROOT = _APP_DIR.parent
+
+# Streamlit re-executes app.py on every rerun, but this module is only
+# imported once; the sentinel also guards against re-imports after reloads.
+if not getattr(sys, "_emojataka_boot", False):
+    # app/ for the `components` package, src/ for `utils` and `visualization`
+    _roots = [str(_APP_DIR), str(_PROJECT_ROOT / "src")]
+    sys.path[:0] = [root for root in _roots if root not in sys.path]
+    sys._emojataka_boot = True
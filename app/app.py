@@ -1,15 +1,13 @@
 """Main Streamlit app - Component Loader and Router."""
 
+import _bootstrap  # noqa: F401  (sets up sys.path for app/ and src/)
+
 import streamlit as st
 from pathlib import Path
-import sys
-import importlib.util
 
-# Add src to path
-project_root = Path(__file__).parent.parent
-src_path = project_root / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+_HERE = Path(__file__).parent
+_PAGES = _HERE / "pages"
+_CSS = _HERE / "assets" / "styles.css"
 
 # Page configuration
 st.set_page_config(
@@ -19,37 +17,48 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource
+def _load_css(path: str) -> str:
+    """Read the custom stylesheet once per process."""
+    css_file = Path(path)
+    return css_file.read_text() if css_file.exists() else ""
+
 # Load custom CSS
-css_path = Path(__file__).parent / "assets" / "styles.css"
-if css_path.exists():
-    with open(css_path) as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+css = _load_css(str(_CSS))
+if css:
+    st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
 
 # Import components
-sys.path.insert(0, str(Path(__file__).parent / "components"))
-from sidebar import render_sidebar
+from components.sidebar import render_sidebar
+
+@st.cache_resource
+def _compile_page(page_file: str, mtime: float):
+    """
+    Read and compile a page script once per process.
 
-# Import pages module
-sys.path.insert(0, str(Path(__file__).parent))
+    Pages are plain top-level scripts, so they still have to be executed on
+    every visit; only the disk read and compilation are cached. ``mtime`` is
+    part of the cache key so edits to a page are picked up.
+    """
+    return compile(Path(page_file).read_text(encoding="utf-8"), page_file, "exec")
 
 def load_page(page_name):
-    """Dynamically load and execute a page module."""
+    """Execute a page script (and its render function, if it defines one)."""
     try:
-        pages_dir = Path(__file__).parent / "pages"
-        page_file = pages_dir / f"{page_name}.py"
+        page_file = _PAGES / f"{page_name}.py"
         
         if not page_file.exists():
             st.error(f"Page not found: {page_name}")
             return
         
-        # Load the module dynamically
-        spec = importlib.util.spec_from_file_location(page_name, page_file)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        code = _compile_page(str(page_file), page_file.stat().st_mtime)
+        namespace = {"__name__": page_name, "__file__": str(page_file)}
+        exec(code, namespace)
         
         # Execute the render function if it exists
-        if hasattr(module, 'render'):
-            module.render()
+        render = namespace.get("render")
+        if callable(render):
+            render()
         # Otherwise, the page script has already executed
         
     except Exception as e:
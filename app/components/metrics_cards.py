@@ -1,11 +1,34 @@
 """Metrics cards component for displaying statistics."""
 
+from html import escape
+from typing import Optional
+
 import streamlit as st
 
+# Card styling for the HTML metric grid, mirroring the [data-testid="stMetric"]
+# rules in assets/styles.css so the grid looks like the st.metric cards
+_METRIC_GRID_CSS = """<style>
+.metric-grid { display: grid; gap: 1rem; margin-bottom: 1rem; }
+.metric-card {
+    background: linear-gradient(135deg, #FFF3E0 0%, #FFE0B2 100%);
+    padding: 1rem; border-radius: 0.75rem;
+    border-left: 4px solid #FF6B35;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    transition: transform 0.2s;
+}
+.metric-card:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 4px 8px rgba(255, 107, 53, 0.2);
+}
+.metric-card .metric-label { font-size: 0.875rem; color: #5D4037; }
+.metric-card .metric-value { font-size: 1.75rem; font-weight: 600; color: #3E2723; }
+.metric-card .metric-delta { font-size: 0.875rem; color: #2E7D32; }
+</style>"""
+
 def render_metric_card(label: str, value: str, help_text: str = ""):
     """
     Render a metric card.
-    
+
     Args:
         label: Label for the metric
         value: Value to display
@@ -13,15 +36,42 @@ def render_metric_card(label: str, value: str, help_text: str = ""):
     """
     st.metric(label=label, value=value, help=help_text)
 
+def _metric_card_html(label: str, value: str, help_text: str = "", delta: str = "") -> str:
+    """HTML for one card of the metric grid (help text becomes a tooltip)."""
+    title = f" title='{escape(help_text, quote=True)}'" if help_text else ""
+    delta_html = f"<div class='metric-delta'>↑ {escape(delta)}</div>" if delta else ""
+    return (
+        f"<div class='metric-card'{title}>"
+        f"<div class='metric-label'>{escape(label)}</div>"
+        f"<div class='metric-value'>{escape(value)}</div>"
+        f"{delta_html}</div>"
+    )
+
+def render_metrics_grid(metrics: list, columns: Optional[int] = None):
+    """
+    Render metric cards as a single HTML grid element.
+
+    Args:
+        metrics: List of tuples (label, value, help_text) or
+            (label, value, help_text, delta)
+        columns: Number of grid columns (defaults to one per metric)
+    """
+    if not metrics:
+        return
+    cards = "".join(_metric_card_html(*metric) for metric in metrics)
+    grid_columns = columns or len(metrics)
+    st.markdown(
+        f"{_METRIC_GRID_CSS}"
+        f"<div class='metric-grid' style='grid-template-columns: repeat({grid_columns}, 1fr);'>"
+        f"{cards}</div>",
+        unsafe_allow_html=True
+    )
+
 def render_metrics_row(metrics: list):
     """
     Render a row of metric cards.
-    
+
     Args:
         metrics: List of tuples (label, value, help_text)
     """
-    cols = st.columns(len(metrics))
-    for i, (label, value, help_text) in enumerate(metrics):
-        with cols[i]:
-            render_metric_card(label, value, help_text)
-
+    render_metrics_grid(metrics, columns=len(metrics))
@@ -1,18 +1,11 @@
 """Enhanced sidebar component with independent navigation."""
 
-import streamlit as st
-from pathlib import Path
-import sys
+import textwrap
 
-# Add src to path for imports
-project_root = Path(__file__).parent.parent.parent
-src_path = project_root / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+import streamlit as st
 
-def hide_streamlit_elements():
-    """Hide Streamlit's default elements."""
-    st.markdown("""
+# Static sidebar markup, built once at import instead of on every rerun
+_HIDE_CSS = """
         <style>
         /* Hide default Streamlit navigation */
         [data-testid="stSidebarNav"] {
@@ -34,20 +27,9 @@ def hide_streamlit_elements():
             padding-top: 1rem;
         }
         </style>
-    """, unsafe_allow_html=True)
+    """
 
-def render_sidebar():
-    """Render the custom sidebar with navigation."""
-    
-    # Hide default Streamlit elements
-    hide_streamlit_elements()
-    
-    # Initialize session state for selected page
-    if 'selected_page' not in st.session_state:
-        st.session_state.selected_page = 'overview'
-    
-    # Header with gradient
-    st.sidebar.markdown("""
+_HEADER_HTML = """
         <div style='text-align: center; padding: 1.5rem 0.5rem; 
                     background: linear-gradient(135deg, #FF6B35 0%, #D84315 100%); 
                     border-radius: 12px; margin-bottom: 1.5rem; 
@@ -61,74 +43,172 @@ def render_sidebar():
                 Emotion Analysis Dashboard
             </p>
         </div>
-    """, unsafe_allow_html=True)
+    """
+
+_STATS_FALLBACK_HTML = """
+            <div style='background: linear-gradient(135deg, #FF8A65 0%, #FFAB91 100%);
+                        padding: 1.3rem; border-radius: 12px;
+                        box-shadow: 0 4px 12px rgba(255, 138, 101, 0.3);'>
+                <p style='margin: 0; font-size: 0.95rem; color: #3E2723;
+                          line-height: 2; font-weight: 500;'>
+                    📖 <strong>314</strong> Stories<br>
+                    🌏 <strong>Thai</strong> Language
+                </p>
+            </div>
+        """
+
+_ABOUT_HTML = """
+        <div style='background: linear-gradient(135deg, #fff3cd 0%, #ffe8a1 100%); 
+                    padding: 1.2rem; border-radius: 10px; 
+                    border-left: 4px solid #ffc107; 
+                    box-shadow: 0 4px 8px rgba(255, 193, 7, 0.2);'>
+            <p style='margin: 0; font-size: 0.88rem; color: #856404; 
+                      line-height: 1.7; font-weight: 400;'>
+                Analyzing emotions in <strong>314 Jataka tales</strong> using the 
+                <strong>NRC Emotion Lexicon</strong>. Discover emotion patterns in 
+                Buddhist narratives through interactive visualizations.
+            </p>
+        </div>
+    """
+
+_FOOTER_HTML = """
+        <div style='text-align: center; font-size: 0.75rem; color: #999; 
+                    padding: 1rem 0; line-height: 1.6;'>
+            <p style='margin: 0;'>Built with <span style='color: #ff4b4b;'>❤️</span> 
+               using <strong>Streamlit</strong></p>
+            <p style='margin: 0.4rem 0 0 0;'>Text Analytics Project 2024</p>
+        </div>
+    """
+
+# 8 emotions shown in the sidebar legend: (icon, name, color)
+_EMOTIONS = (
+    ("🤝", "Trust", "#1f77b4"),
+    ("😊", "Joy", "#ff7f0e"),
+    ("😠", "Anger", "#d62728"),
+    ("⏳", "Anticipation", "#9467bd"),
+    ("😨", "Fear", "#8c564b"),
+    ("🤢", "Disgust", "#e377c2"),
+    ("😲", "Surprise", "#7f7f7f"),
+    ("😢", "Sadness", "#17becf"),
+)
+
+# Two-column legend grid for _EMOTIONS
+_EMOTIONS_LEGEND_HTML = (
+    "<div style='display: grid; grid-template-columns: 1fr 1fr; gap: 0.3rem;'>"
+    + "".join(
+        f"<div style='text-align: center; padding: 0.4rem; "
+        f"background: {color}20; border-radius: 8px; "
+        f"border-left: 3px solid {color};'>"
+        f"<span style='font-size: 1.1rem;'>{icon}</span><br>"
+        f"<span style='font-size: 0.75rem; color: {color}; font-weight: 600;'>{name}</span>"
+        f"</div>"
+        for icon, name, color in _EMOTIONS
+    )
+    + "</div>"
+)
+
+# Separator + heading above the Quick Stats card
+_STATS_HEADER_MD = "---\n\n### 📊 Quick Stats"
+
+# Everything below Quick Stats is static, so it is joined into one markdown
+# block (one delta per rerun instead of eight). Blocks are dedented so the
+# indented HTML is not parsed as a markdown code block.
+_STATIC_BOTTOM_HTML = "\n\n".join(
+    textwrap.dedent(block).strip()
+    for block in (
+        "---",
+        "### 💭 Emotions",
+        _EMOTIONS_LEGEND_HTML,
+        "---",
+        "### ℹ️ About",
+        _ABOUT_HTML,
+        "---",
+        _FOOTER_HTML,
+    )
+)
+
+# Navigation items (independent of file names)
+_NAV_ITEMS = (
+    {
+        "id": "overview",
+        "icon": "🪷",
+        "title": "Overview",
+        "description": "Dataset summary & statistics"
+    },
+    {
+        "id": "emotion_analysis",
+        "icon": "🌟",
+        "title": "Emotion Analysis",
+        "description": "Explore emotion profiles & patterns"
+    },
+    {
+        "id": "story_groups",
+        "icon": "🎭",
+        "title": "Story Groups",
+        "description": "View clusters & groupings"
+    },
+    {
+        "id": "story_explorer",
+        "icon": "📖",
+        "title": "Story Explorer",
+        "description": "Search & browse chapters"
+    },
+    {
+        "id": "text_insights",
+        "icon": "📊",
+        "title": "Text Insights",
+        "description": "Word clouds & text analysis"
+    },
+)
+
+def _nav_display(item):
+    """Selectbox label for a navigation item."""
+    return f"{item['icon']} {item['title']}"
+
+# Lookups derived once from _NAV_ITEMS: id -> item, label -> id, labels
+_NAV_BY_ID = {item["id"]: item for item in _NAV_ITEMS}
+_NAV_OPTIONS = {_nav_display(item): item["id"] for item in _NAV_ITEMS}
+_NAV_DISPLAYS = tuple(_NAV_OPTIONS)
+
+def hide_streamlit_elements():
+    """Hide Streamlit's default elements."""
+    st.markdown(_HIDE_CSS, unsafe_allow_html=True)
+
+def render_sidebar():
+    """Render the custom sidebar with navigation."""
     
-    # Navigation section
-    st.sidebar.markdown("### 🧭 Navigation")
+    # Hide default Streamlit elements
+    hide_streamlit_elements()
     
-    # Define navigation items (independent of file names)
-    nav_items = [
-        {
-            "id": "overview",
-            "icon": "🪷",
-            "title": "Overview",
-            "description": "Dataset summary & statistics"
-        },
-        {
-            "id": "emotion_analysis",
-            "icon": "🌟",
-            "title": "Emotion Analysis",
-            "description": "Explore emotion profiles & patterns"
-        },
-        {
-            "id": "story_groups",
-            "icon": "🎭",
-            "title": "Story Groups",
-            "description": "View clusters & groupings"
-        },
-        {
-            "id": "story_explorer",
-            "icon": "📖",
-            "title": "Story Explorer",
-            "description": "Search & browse chapters"
-        },
-        {
-            "id": "text_insights",
-            "icon": "📊",
-            "title": "Text Insights",
-            "description": "Word clouds & text analysis"
-        }
-    ]
+    # Initialize session state for selected page
+    if 'selected_page' not in st.session_state:
+        st.session_state.selected_page = 'overview'
+    
+    # Header with gradient
+    st.sidebar.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
-    # Create simple selectbox for navigation
-    nav_options = {f"{item['icon']} {item['title']}": item['id'] for item in nav_items}
+    # Navigation section
+    st.sidebar.markdown("### 🧭 Navigation")
     
     # Find current selection for display
-    current_display = None
-    for display, page_id in nav_options.items():
-        if page_id == st.session_state.selected_page:
-            current_display = display
-            break
-    
-    if current_display is None:
-        current_display = list(nav_options.keys())[0]
+    current_item = _NAV_BY_ID.get(st.session_state.selected_page, _NAV_ITEMS[0])
+    current_display = _nav_display(current_item)
     
     # Use selectbox for navigation
     selected_display = st.sidebar.selectbox(
         "Choose a page",
-        options=list(nav_options.keys()),
-        index=list(nav_options.keys()).index(current_display),
+        options=_NAV_DISPLAYS,
+        index=_NAV_DISPLAYS.index(current_display),
         key="page_selector"
     )
     
-    # Update session state
-    selected_id = nav_options[selected_display]
-    if selected_id != st.session_state.selected_page:
-        st.session_state.selected_page = selected_id
-        st.rerun()
+    # Update session state; the selectbox change already triggered this
+    # rerun, so the router picks up the new page without another st.rerun()
+    selected_id = _NAV_OPTIONS[selected_display]
+    st.session_state.selected_page = selected_id
     
     # Show description of selected page
-    current_item = [item for item in nav_items if item['id'] == selected_id][0]
+    current_item = _NAV_BY_ID[selected_id]
     st.sidebar.markdown(f"""
         <div style='background-color: #f0f2f6; padding: 0.8rem; 
                     border-radius: 8px; margin-top: 0.5rem;'>
@@ -138,13 +218,11 @@ def render_sidebar():
         </div>
     """, unsafe_allow_html=True)
     
-    st.sidebar.markdown("---")
-    
     # Quick stats section
-    st.sidebar.markdown("### 📊 Quick Stats")
+    st.sidebar.markdown(_STATS_HEADER_MD)
     
     try:
-        from utils.data_loader import get_dataset_stats
+        from utils import get_dataset_stats
         stats = get_dataset_stats()
         
         st.sidebar.markdown(f"""
@@ -168,91 +246,9 @@ def render_sidebar():
             </div>
         """, unsafe_allow_html=True)
     except Exception:
-        st.sidebar.markdown("""
-            <div style='background: linear-gradient(135deg, #FF8A65 0%, #FFAB91 100%);
-                        padding: 1.3rem; border-radius: 12px;
-                        box-shadow: 0 4px 12px rgba(255, 138, 101, 0.3);'>
-                <p style='margin: 0; font-size: 0.95rem; color: #3E2723;
-                          line-height: 2; font-weight: 500;'>
-                    📖 <strong>314</strong> Stories<br>
-                    🌏 <strong>Thai</strong> Language
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    st.sidebar.markdown("---")
-    
-    # 8 Emotions legend with enhanced styling
-    st.sidebar.markdown("### 💭 Emotions")
-    
-    emotions = [
-        ("🤝", "Trust", "#1f77b4"),
-        ("😊", "Joy", "#ff7f0e"),
-        ("😠", "Anger", "#d62728"),
-        ("⏳", "Anticipation", "#9467bd"),
-        ("😨", "Fear", "#8c564b"),
-        ("🤢", "Disgust", "#e377c2"),
-        ("😲", "Surprise", "#7f7f7f"),
-        ("😢", "Sadness", "#17becf")
-    ]
-    
-    # Display in 2-column layout using Streamlit columns
-    for i in range(0, len(emotions), 2):
-        col1, col2 = st.sidebar.columns(2)
-        
-        with col1:
-            if i < len(emotions):
-                icon, name, color = emotions[i]
-                st.markdown(
-                    f"<div style='text-align: center; padding: 0.4rem; "
-                    f"background: {color}20; border-radius: 8px; "
-                    f"border-left: 3px solid {color};'>"
-                    f"<span style='font-size: 1.1rem;'>{icon}</span><br>"
-                    f"<span style='font-size: 0.75rem; color: {color}; font-weight: 600;'>{name}</span>"
-                    f"</div>",
-                    unsafe_allow_html=True
-                )
-        
-        with col2:
-            if i + 1 < len(emotions):
-                icon, name, color = emotions[i + 1]
-                st.markdown(
-                    f"<div style='text-align: center; padding: 0.4rem; "
-                    f"background: {color}20; border-radius: 8px; "
-                    f"border-left: 3px solid {color};'>"
-                    f"<span style='font-size: 1.1rem;'>{icon}</span><br>"
-                    f"<span style='font-size: 0.75rem; color: {color}; font-weight: 600;'>{name}</span>"
-                    f"</div>",
-                    unsafe_allow_html=True
-                )
+        st.sidebar.markdown(_STATS_FALLBACK_HTML, unsafe_allow_html=True)
     
-    st.sidebar.markdown("---")
-    
-    # About section
-    st.sidebar.markdown("### ℹ️ About")
-    st.sidebar.markdown("""
-        <div style='background: linear-gradient(135deg, #fff3cd 0%, #ffe8a1 100%); 
-                    padding: 1.2rem; border-radius: 10px; 
-                    border-left: 4px solid #ffc107; 
-                    box-shadow: 0 4px 8px rgba(255, 193, 7, 0.2);'>
-            <p style='margin: 0; font-size: 0.88rem; color: #856404; 
-                      line-height: 1.7; font-weight: 400;'>
-                Analyzing emotions in <strong>300 Jataka tales</strong> using the 
-                <strong>NRC Emotion Lexicon</strong>. Discover emotion patterns in 
-                Buddhist narratives through interactive visualizations.
-            </p>
-        </div>
-    """, unsafe_allow_html=True)
-    
-    # Footer
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("""
-        <div style='text-align: center; font-size: 0.75rem; color: #999; 
-                    padding: 1rem 0; line-height: 1.6;'>
-            <p style='margin: 0;'>Built with <span style='color: #ff4b4b;'>❤️</span> 
-               using <strong>Streamlit</strong></p>
-            <p style='margin: 0.4rem 0 0 0;'>Text Analytics Project 2024</p>
-        </div>
-    """, unsafe_allow_html=True)
+    # Emotions legend, About card and footer in a single static block
+    st.sidebar.markdown(_STATIC_BOTTOM_HTML, unsafe_allow_html=True)
     
     return st.session_state.selected_page
\ No newline at end of file
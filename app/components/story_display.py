@@ -2,7 +2,7 @@
 
 import streamlit as st
 import pandas as pd
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 
 def display_story_info(
     story_data: pd.Series,
@@ -19,24 +19,22 @@ def display_story_info(
         title_col: Column name for title
         text_col: Column name for text content
     """
-    if isinstance(story_data, pd.Series):
-        story_dict = story_data.to_dict()
-    else:
-        story_dict = story_data
-    
+    # Series and dict both support `in` (index/keys) and [] lookups,
+    # so no to_dict() copy is needed
     # Display chapter info
-    if chapter_col in story_dict:
-        st.subheader(f"Chapter {story_dict[chapter_col]}")
-    
-    if title_col and title_col in story_dict:
-        st.markdown(f"**Title:** {story_dict[title_col]}")
-    
+    if chapter_col in story_data:
+        st.subheader(f"Chapter {story_data[chapter_col]}")
+
+    if title_col and title_col in story_data:
+        st.markdown(f"**Title:** {story_data[title_col]}")
+
     # Display full text
-    if text_col and text_col in story_dict:
+    if text_col and text_col in story_data:
         with st.expander("📖 Story Text", expanded=False):
-            text = str(story_dict[text_col])
+            raw = story_data[text_col]
+            text = raw if isinstance(raw, str) else str(raw)
             st.text(text)
-            st.caption(f"Total: {len(text)} characters")
+            st.caption(f"Total: {len(text):,} characters")
 
 def display_emotion_words(
     emotion_words_df: pd.DataFrame,
@@ -70,51 +68,39 @@ def display_emotion_words(
     
     # Group by emotion if possible
     if 'emotion' in filtered.columns:
-        for emotion in filtered['emotion'].unique():
-            emotion_words = filtered[filtered['emotion'] == emotion]
-            if 'word' in emotion_words.columns:
-                words = emotion_words['word'].head(max_words).tolist()
+        if 'word' in filtered.columns:
+            # Single groupby pass instead of one boolean mask per emotion
+            grouped = filtered.groupby('emotion', sort=False, observed=True)['word'].apply(
+                lambda s: s.head(max_words).tolist()
+            )
+            for emotion, words in grouped.items():
                 st.markdown(f"**{emotion.title()}:** {', '.join(words)}")
     elif 'word' in filtered.columns:
         words = filtered['word'].head(max_words).tolist()
         st.markdown(f"**Words:** {', '.join(words)}")
 
 def display_similar_stories(
-    similarity_df: pd.DataFrame,
-    chapter_id: int,
-    stories_df: pd.DataFrame,
-    top_n: int = 5
+    similar_stories: List[Tuple[int, float]],
+    title_map: Dict[int, str]
 ):
     """
     Display similar stories based on emotion similarity.
     
     Args:
-        similarity_df: DataFrame with similarity scores
-        chapter_id: Current chapter ID
-        stories_df: DataFrame with story information
-        top_n: Number of similar stories to show
+        similar_stories: (similar_chapter, similarity) pairs for the current
+            chapter, highest first (e.g. one entry of get_top_k_similar())
+        title_map: Chapter -> story title (e.g. get_chapter_title_map())
     """
-    if similarity_df.empty:
-        return
-    
     st.subheader("📚 Similar Stories")
     
-    # Find similar chapters
-    if 'chapter' in similarity_df.columns and 'similarity' in similarity_df.columns:
-        similar = similarity_df[similarity_df['chapter'] == chapter_id].nlargest(top_n, 'similarity')
-        
-        if not similar.empty:
-            for idx, row in similar.iterrows():
-                similar_chapter = row.get('similar_chapter', row.get('chapter_2', 'N/A'))
-                similarity_score = row.get('similarity', 0)
-                
-                # Get story info
-                story_info = stories_df[stories_df.get('chapter', stories_df.index) == similar_chapter]
-                if not story_info.empty:
-                    title = story_info.iloc[0].get('title', f"Chapter {similar_chapter}")
-                    st.markdown(f"- **Chapter {similar_chapter}:** {title} (similarity: {similarity_score:.3f})")
+    if not similar_stories:
+        st.info("No similar stories found.")
+        return
+    
+    for similar_chapter, similarity in similar_stories:
+        title = title_map.get(similar_chapter)
+        if title is not None:
+            st.markdown(f"- **Chapter {similar_chapter}:** {title} (similarity: {similarity:.3f})")
         else:
-            st.info("No similar stories found.")
-    else:
-        st.info("Similarity data not available.")
+            st.markdown(f"- **Chapter {similar_chapter}** (similarity: {similarity:.3f})")
 
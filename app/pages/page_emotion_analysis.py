@@ -1,28 +1,50 @@
 """Emotion Analysis page for the Jataka Emotion Analysis app."""
 
 import streamlit as st
-import sys
-from pathlib import Path
 
-# Add src to path - handle both running from root and from app directory
-project_root = Path(__file__).parent.parent.parent
-src_path = project_root / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+import _bootstrap  # noqa: F401  (app/ is on sys.path as app.py's directory; adds src/)
 
 from utils.data_loader import (
     load_cluster_emotions, load_emotion_scores,
-    load_cluster_assignments, load_stories
+    load_emotion_scores_by_chapter, load_stories_by_chapter,
+    load_cluster_assignments_by_cluster,
+    get_cluster_options, get_chapter_options, compute_overall_emotion_means, rows_for
 )
+from utils.config import EMOTION_SET
 from utils.emotion_scaling import get_scaling_description
 from visualization.star_plot import create_star_plot, create_star_plot_from_df, create_comparison_star_plot
 from visualization.charts import create_emotion_bar_chart, create_emotion_bar_chart_from_df
 
-st.set_page_config(
-    page_title="Emotion Analysis - Jataka Emotion Analysis",
-    page_icon="🌟",
-    layout="wide"
-)
+# Only configure the page when run standalone; the app.py router has
+# already called set_page_config before exec'ing this script
+if __name__ == "__main__":
+    st.set_page_config(
+        page_title="Emotion Analysis - Jataka Emotion Analysis",
+        page_icon="🌟",
+        layout="wide"
+    )
+
+# Figure builders cached on (emotion items, labels, theme, scaling) so tab
+# switches and unrelated widget changes reuse already-built figures. Items are
+# passed as tuples in their original order (the bar chart keeps dict order).
+@st.cache_data(show_spinner=False)
+def _cached_star_plot(data_items: tuple, title: str, theme: str, scaling: str):
+    return create_star_plot(dict(data_items), title, theme=theme, scaling=scaling)
+
+@st.cache_data(show_spinner=False)
+def _cached_bar_chart(data_items: tuple, title: str, theme: str, scaling: str):
+    return create_emotion_bar_chart(dict(data_items), title, theme=theme, scaling=scaling)
+
+@st.cache_data(show_spinner=False)
+def _cached_comparison_star_plot(
+    primary_items: tuple, comparison_items: tuple, primary_label: str,
+    comparison_label: str, title: str, theme: str, scaling: str
+):
+    return create_comparison_star_plot(
+        dict(primary_items), dict(comparison_items),
+        primary_label=primary_label, comparison_label=comparison_label,
+        title=title, theme=theme, scaling=scaling
+    )
 
 st.title("🌟 Emotion Analysis")
 
@@ -54,7 +76,13 @@ with col_scaling:
 with st.expander("ℹ️ About Score Display Methods"):
     st.markdown(get_scaling_description(scaling_method))
 
-st.markdown("---")
+st.divider()
+
+# Overall emotion means, computed once and reused by all three tabs
+try:
+    overall_means = compute_overall_emotion_means()
+except Exception:
+    overall_means = {}
 
 # Create tabs
 tab1, tab2, tab3 = st.tabs(["📊 All Stories Combined", "🎭 By Story Group", "📖 Individual Story"])
@@ -70,27 +98,27 @@ with tab1:
         if not chapter_emotions.empty:
             # Get emotion columns
             emotion_cols = [col for col in chapter_emotions.columns
-                          if col.lower() in ['trust', 'joy', 'anger', 'anticipation',
-                                            'fear', 'disgust', 'surprise', 'sadness']]
+                          if col.lower() in EMOTION_SET]
 
             if emotion_cols:
-                # Calculate mean emotion scores across all chapters
-                emotion_data = {col: chapter_emotions[col].mean()
-                              for col in emotion_cols if col in chapter_emotions.columns}
+                # Mean emotion scores across all chapters
+                emotion_data = overall_means
 
                 # Charts
                 col1, col2 = st.columns(2)
 
                 with col1:
                     st.subheader("Star Plot")
-                    fig_star = create_star_plot(emotion_data, "Overall Emotion Profile (Mean Across All Chapters)",
-                                               theme=plot_theme, scaling=scaling_method)
+                    fig_star = _cached_star_plot(tuple(emotion_data.items()),
+                                                 "Overall Emotion Profile (Mean Across All Chapters)",
+                                                 plot_theme, scaling_method)
                     st.plotly_chart(fig_star, use_container_width=True, key="tab1_star_plot")
 
                 with col2:
                     st.subheader("Bar Chart")
-                    fig_bar = create_emotion_bar_chart(emotion_data, "Emotion Distribution (Mean Across All Chapters)",
-                                                       theme=plot_theme, scaling=scaling_method)
+                    fig_bar = _cached_bar_chart(tuple(emotion_data.items()),
+                                                "Emotion Distribution (Mean Across All Chapters)",
+                                                plot_theme, scaling_method)
                     st.plotly_chart(fig_bar, use_container_width=True, key="tab1_bar_chart")
                 
                 # Key insights
@@ -121,12 +149,12 @@ with tab2:
     
     try:
         cluster_emotions = load_cluster_emotions()
-        cluster_assignments = load_cluster_assignments()
-        stories = load_stories()
+        cluster_assignments = load_cluster_assignments_by_cluster()
+        stories = load_stories_by_chapter()
         
         if not cluster_emotions.empty and 'cluster' in cluster_emotions.columns:
             # Get available clusters
-            available_clusters = sorted(cluster_emotions['cluster'].unique())
+            available_clusters = get_cluster_options()
             
             if available_clusters:
                 selected_cluster = st.selectbox(
@@ -141,48 +169,40 @@ with tab2:
                 if not cluster_data.empty:
                     # Get emotion columns
                     emotion_cols = [col for col in cluster_data.columns 
-                                  if col.lower() in ['trust', 'joy', 'anger', 'anticipation', 
-                                                    'fear', 'disgust', 'surprise', 'sadness']]
+                                  if col.lower() in EMOTION_SET]
                     
                     if emotion_cols:
-                        cluster_emotion_data = {col: cluster_data[col].iloc[0]
-                                              for col in emotion_cols if col in cluster_data.columns}
+                        cluster_emotion_data = dict(zip(emotion_cols, cluster_data[emotion_cols].values[0]))
 
-                        # Get overall emotions for comparison (mean across all chapters)
-                        try:
-                            all_chapters = load_emotion_scores()
-                            overall_emotion_data = {col: all_chapters[col].mean()
-                                                  for col in emotion_cols if col in all_chapters.columns}
-                        except:
-                            overall_emotion_data = None
+                        # Overall emotions for comparison (mean across all chapters)
+                        overall_emotion_data = {col: overall_means[col]
+                                              for col in emotion_cols if col in overall_means}
 
                         # Single comparison star plot
                         if overall_emotion_data:
-                            fig_comparison = create_comparison_star_plot(
-                                cluster_emotion_data,
-                                overall_emotion_data,
-                                primary_label=f"Cluster {selected_cluster}",
-                                comparison_label="Overall Average",
-                                title=f"Cluster {selected_cluster} vs Overall Average",
-                                theme=plot_theme,
-                                scaling=scaling_method
+                            fig_comparison = _cached_comparison_star_plot(
+                                tuple(cluster_emotion_data.items()),
+                                tuple(overall_emotion_data.items()),
+                                f"Cluster {selected_cluster}",
+                                "Overall Average",
+                                f"Cluster {selected_cluster} vs Overall Average",
+                                plot_theme,
+                                scaling_method
                             )
                             st.plotly_chart(fig_comparison, use_container_width=True, key=f"tab2_cluster_{selected_cluster}_comparison")
                         else:
                             # Fallback to single plot if no comparison data
-                            fig_cluster = create_star_plot(
-                                cluster_emotion_data,
+                            fig_cluster = _cached_star_plot(
+                                tuple(cluster_emotion_data.items()),
                                 f"Cluster {selected_cluster} Emotions",
-                                theme=plot_theme,
-                                scaling=scaling_method
+                                plot_theme,
+                                scaling_method
                             )
                             st.plotly_chart(fig_cluster, use_container_width=True, key=f"tab2_cluster_{selected_cluster}_star")
                         
                         # Stories in this cluster
                         if not cluster_assignments.empty:
-                            cluster_chapters = cluster_assignments[
-                                cluster_assignments['cluster'] == selected_cluster
-                            ]
+                            cluster_chapters = rows_for(cluster_assignments, selected_cluster)
                             
                             st.subheader(f"📚 Stories in Cluster {selected_cluster}")
                             st.info(f"**Total chapters in this cluster:** {len(cluster_chapters)}")
@@ -191,12 +211,14 @@ with tab2:
                             if 'chapter' in cluster_chapters.columns:
                                 chapters = cluster_chapters['chapter'].tolist()
                                 if 'chapter' in stories.columns:
-                                    chapter_info = []
-                                    for ch in chapters[:20]:  # Show first 20
-                                        story_info = stories[stories['chapter'] == ch]
-                                        if not story_info.empty:
-                                            title = story_info.iloc[0].get('title', f"Chapter {ch}")
-                                            chapter_info.append(f"- **Chapter {ch}:** {title}")
+                                    # Show first 20; titles come from one indexed reindex
+                                    shown = [ch for ch in chapters[:20] if ch in stories.index]
+                                    if 'title' in stories.columns:
+                                        titles = stories['title'].reindex(shown).tolist()
+                                    else:
+                                        titles = [f"Chapter {ch}" for ch in shown]
+                                    chapter_info = [f"- **Chapter {ch}:** {title}"
+                                                    for ch, title in zip(shown, titles)]
                                     
                                     if chapter_info:
                                         st.markdown("\n".join(chapter_info))
@@ -223,13 +245,13 @@ with tab3:
     st.header("Individual Story")
     
     try:
-        emotion_scores = load_emotion_scores()
-        stories = load_stories()
+        emotion_scores = load_emotion_scores_by_chapter()
+        stories = load_stories_by_chapter()
         
         if not emotion_scores.empty and not stories.empty:
             # Get chapter options
             if 'chapter' in emotion_scores.columns:
-                chapters = sorted(emotion_scores['chapter'].unique())
+                chapters = get_chapter_options()
             elif 'chapter' in stories.columns:
                 chapters = sorted(stories['chapter'].unique())
             else:
@@ -243,47 +265,50 @@ with tab3:
             )
             
             # Get chapter emotion data
-            chapter_data = emotion_scores[emotion_scores['chapter'] == selected_chapter]
+            chapter_data = rows_for(emotion_scores, selected_chapter)
             
             if not chapter_data.empty:
                 # Get emotion columns
                 emotion_cols = [col for col in chapter_data.columns 
-                              if col.lower() in ['trust', 'joy', 'anger', 'anticipation', 
-                                                'fear', 'disgust', 'surprise', 'sadness']]
+                              if col.lower() in EMOTION_SET]
                 
                 if emotion_cols:
-                    chapter_emotion_data = {col: chapter_data[col].iloc[0]
-                                          for col in emotion_cols if col in chapter_data.columns}
+                    chapter_emotion_data = dict(zip(emotion_cols, chapter_data[emotion_cols].values[0]))
 
-                    # Get overall emotions for comparison (mean across all chapters)
-                    overall_emotion_data = {col: emotion_scores[col].mean()
-                                          for col in emotion_cols if col in emotion_scores.columns}
+                    # Overall emotions for comparison (mean across all chapters)
+                    overall_emotion_data = {col: overall_means[col]
+                                          for col in emotion_cols if col in overall_means}
 
                     # Single comparison star plot
-                    fig_comparison = create_comparison_star_plot(
-                        chapter_emotion_data,
-                        overall_emotion_data,
-                        primary_label=f"Chapter {selected_chapter}",
-                        comparison_label="Overall Average",
-                        title=f"Chapter {selected_chapter} vs Overall Average",
-                        theme=plot_theme,
-                        scaling=scaling_method
+                    fig_comparison = _cached_comparison_star_plot(
+                        tuple(chapter_emotion_data.items()),
+                        tuple(overall_emotion_data.items()),
+                        f"Chapter {selected_chapter}",
+                        "Overall Average",
+                        f"Chapter {selected_chapter} vs Overall Average",
+                        plot_theme,
+                        scaling_method
                     )
                     st.plotly_chart(fig_comparison, use_container_width=True, key=f"tab3_chapter_{selected_chapter}_comparison")
                     
                     # Story text preview
-                    story_info = stories[stories['chapter'] == selected_chapter]
+                    story_info = rows_for(stories, selected_chapter)
                     if not story_info.empty:
                         st.subheader("📖 Story Preview")
                         with st.expander("View Story Text", expanded=False):
                             text_col = 'text' if 'text' in story_info.columns else story_info.columns[-1]
-                            text = story_info[text_col].iloc[0]
+                            raw = story_info[text_col].iloc[0]
+                            # Stringify only non-str cells, and slice before building the preview
+                            if isinstance(raw, str):
+                                text = raw
+                            else:
+                                text = "" if raw is None else str(raw)
                             preview_length = 1000
-                            if len(str(text)) > preview_length:
-                                st.text(str(text)[:preview_length] + "...")
+                            if len(text) > preview_length:
+                                st.text(text[:preview_length] + "...")
                                 st.caption(f"Showing first {preview_length} characters")
                             else:
-                                st.text(str(text))
+                                st.text(text)
                 else:
                     st.warning("Emotion columns not found in chapter data.")
             else:
@@ -1,85 +1,138 @@
 """Overview page for the Jataka Emotion Analysis app."""
 
 import streamlit as st
-import sys
-from pathlib import Path
 
-# Add src to path - handle both running from root and from app directory
-project_root = Path(__file__).parent.parent.parent
-src_path = project_root / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+import _bootstrap  # noqa: F401  (app/ is on sys.path as app.py's directory; adds src/)
 
-from utils.data_loader import get_dataset_stats, load_emotion_scores
+from utils.data_loader import (
+    get_dataset_stats, load_emotion_scores, compute_overall_emotion_means,
+    get_overall_emotion_extremes
+)
+from utils.config import EMOTION_SET
 from utils.emotion_scaling import get_scaling_description
 from visualization.charts import create_emotion_bar_chart
 
-# Import components from app directory
-components_path = Path(__file__).parent.parent / "components"
-if str(components_path) not in sys.path:
-    sys.path.insert(0, str(components_path))
-from metrics_cards import render_metrics_row
-
-st.set_page_config(
-    page_title="Overview - Jataka Emotion Analysis",
-    page_icon="🪷",
-    layout="wide"
-)
-
-st.title("🪷 Overview")
-
-# Global controls for all plots on this page
-col_theme, col_scaling = st.columns(2)
-
-with col_theme:
-    plot_theme = st.selectbox(
-        "🎨 Plot Theme",
-        options=["light", "dark"],
-        format_func=lambda x: "☀️ Light" if x == "light" else "🌙 Dark",
-        key="overview_global_theme"
-    )
+# Components from the app/components package
+from components.metrics_cards import render_metrics_row
 
-with col_scaling:
-    scaling_method = st.selectbox(
-        "📊 Score Display",
-        options=["minmax", "baseline", "raw"],
-        format_func=lambda x: {
-            "minmax": "Highlight Differences (Min-Max)",
-            "baseline": "Above/Below Baseline",
-            "raw": "Raw Scores"
-        }[x],
-        index=0,  # Default to minmax
-        key="overview_scaling"
+# Only configure the page when run standalone; the app.py router has
+# already called set_page_config before exec'ing this script
+if __name__ == "__main__":
+    st.set_page_config(
+        page_title="Overview - Jataka Emotion Analysis",
+        page_icon="🪷",
+        layout="wide"
     )
 
-# Show scaling method description
-with st.expander("ℹ️ About Score Display Methods"):
-    st.markdown(get_scaling_description(scaling_method))
+# Static page copy as literal HTML: st.html skips the markdown parser that
+# st.markdown would run on every rerun
+_ABOUT_HTML = """
+<p>This project analyzes emotions in <strong>314 Jataka tales</strong> (Buddhist stories of Buddha's previous lives)
+written in Thai language.</p>
+
+<h3>🎯 Core Analysis</h3>
+<ul>
+  <li><strong>Emotion Analysis</strong>: 8 basic emotions (trust, joy, anger, anticipation, fear, disgust, surprise, sadness)</li>
+  <li><strong>Analysis Levels</strong>:
+    <ul>
+      <li>Overall (all stories combined)</li>
+      <li>Cluster-level (K-means grouped stories)</li>
+      <li>Story-level (individual story analysis)</li>
+    </ul>
+  </li>
+  <li><strong>Text Analysis</strong>: Word clouds, POS tagging, NER, and text statistics</li>
+</ul>
+
+<h3>🔧 Technical Approach</h3>
+<ul>
+  <li><strong>Emotion Detection</strong>: Lexicon-based matching with NRC Thai lexicon</li>
+  <li><strong>Clustering</strong>: K-means on TF-IDF features for story grouping</li>
+  <li><strong>NLP Processing</strong>: PyThaiNLP for tokenization, POS tagging, and NER</li>
+  <li><strong>Visualization</strong>: Interactive dashboard with star plots, word clouds, and charts</li>
+</ul>
+"""
+
+_EXPLORE_LEFT_HTML = """
+<h3>🌟 Emotion Analysis</h3>
+<ul>
+  <li>View emotion profiles across all stories</li>
+  <li>Compare emotions by story groups (clusters)</li>
+  <li>Analyze individual story emotions</li>
+  <li>Interactive star plots and bar charts</li>
+</ul>
+
+<h3>🎭 Story Groups</h3>
+<ul>
+  <li>Explore K-means clusters</li>
+  <li>Visualize story groupings in 2D</li>
+  <li>Compare emotion patterns across clusters</li>
+</ul>
+"""
+
+_EXPLORE_RIGHT_HTML = """
+<h3>📖 Story Explorer</h3>
+<ul>
+  <li>Search and browse individual chapters</li>
+  <li>View detailed emotion profiles</li>
+  <li>Find similar stories</li>
+  <li>Read story text previews</li>
+</ul>
+
+<h3>📊 Text Insights</h3>
+<ul>
+  <li>Word clouds by cluster and emotion</li>
+  <li>POS tag distribution</li>
+  <li>Named entity recognition results</li>
+  <li>Language pattern analysis</li>
+</ul>
+"""
+
+@st.fragment
+def _render_overall_emotion_chart(emotion_data: dict):
+    """
+    Plot controls and the overall emotion bar chart.
+
+    Runs as a fragment, so changing the theme or score display reruns only
+    this block instead of the whole page.
+    """
+    col_theme, col_scaling = st.columns(2)
+
+    with col_theme:
+        plot_theme = st.selectbox(
+            "🎨 Plot Theme",
+            options=["light", "dark"],
+            format_func=lambda x: "☀️ Light" if x == "light" else "🌙 Dark",
+            key="overview_global_theme"
+        )
+
+    with col_scaling:
+        scaling_method = st.selectbox(
+            "📊 Score Display",
+            options=["minmax", "baseline", "raw"],
+            format_func=lambda x: {
+                "minmax": "Highlight Differences (Min-Max)",
+                "baseline": "Above/Below Baseline",
+                "raw": "Raw Scores"
+            }[x],
+            index=0,  # Default to minmax
+            key="overview_scaling"
+        )
+
+    # Show scaling method description
+    with st.expander("ℹ️ About Score Display Methods"):
+        st.markdown(get_scaling_description(scaling_method))
+
+    fig = create_emotion_bar_chart(emotion_data, "Overall Emotion Scores (Mean Across All Chapters)",
+                                  theme=plot_theme, scaling=scaling_method)
+    st.plotly_chart(fig, use_container_width=True, key="overview_emotion_bar")
 
-st.markdown("---")
+st.title("🪷 Overview")
 
 # Project description
 st.header("📚 About This Project")
-st.markdown("""
-This project analyzes emotions in **314 Jataka tales** (Buddhist stories of Buddha's previous lives)
-written in Thai language.
-
-### 🎯 Core Analysis
-- **Emotion Analysis**: 8 basic emotions (trust, joy, anger, anticipation, fear, disgust, surprise, sadness)
-- **Analysis Levels**:
-  - Overall (all stories combined)
-  - Cluster-level (K-means grouped stories)
-  - Story-level (individual story analysis)
-- **Text Analysis**: Word clouds, POS tagging, NER, and text statistics
-
-### 🔧 Technical Approach
-- **Emotion Detection**: Lexicon-based matching with NRC Thai lexicon
-- **Clustering**: K-means on TF-IDF features for story grouping
-- **NLP Processing**: PyThaiNLP for tokenization, POS tagging, and NER
-- **Visualization**: Interactive dashboard with star plots, word clouds, and charts
-""")
-
-st.markdown("---")
+st.html(_ABOUT_HTML)
+
+st.divider()
 
 # Dataset statistics
 st.header("📊 Dataset Quick Facts")
@@ -101,7 +154,7 @@ except Exception as e:
     st.error(f"Error loading dataset statistics: {e}")
     st.info("Using default values. Please ensure data files are available.")
 
-st.markdown("---")
+st.divider()
 
 # Overall emotion distribution
 st.header("🌟 Overall Emotion Distribution")
@@ -113,21 +166,16 @@ try:
     if not chapter_emotions.empty:
         # Get emotion columns
         emotion_cols = [col for col in chapter_emotions.columns
-                       if col.lower() in ['trust', 'joy', 'anger', 'anticipation',
-                                         'fear', 'disgust', 'surprise', 'sadness']]
+                       if col.lower() in EMOTION_SET]
 
         if emotion_cols:
-            # Calculate mean emotion scores across all chapters
-            emotion_data = {col: chapter_emotions[col].mean()
-                          for col in emotion_cols if col in chapter_emotions.columns}
+            # Mean emotion scores across all chapters (cached across reruns)
+            emotion_data = compute_overall_emotion_means()
 
-            fig = create_emotion_bar_chart(emotion_data, "Overall Emotion Scores (Mean Across All Chapters)",
-                                          theme=plot_theme, scaling=scaling_method)
-            st.plotly_chart(fig, use_container_width=True, key="overview_emotion_bar")
+            _render_overall_emotion_chart(emotion_data)
 
-            # Key insights
-            max_emotion = max(emotion_data.items(), key=lambda x: x[1])
-            min_emotion = min(emotion_data.items(), key=lambda x: x[1])
+            # Key insights (argmax/argmin over the cached mean vector)
+            max_emotion, min_emotion = get_overall_emotion_extremes()
             
             st.info(f"""
             **Key Insights:**
@@ -144,7 +192,7 @@ except FileNotFoundError:
 except Exception as e:
     st.error(f"Error loading overall emotions: {e}")
 
-st.markdown("---")
+st.divider()
 
 # What you can explore
 st.header("🔍 What You Can Explore")
@@ -152,35 +200,8 @@ st.header("🔍 What You Can Explore")
 col1, col2 = st.columns(2)
 
 with col1:
-    st.markdown("""
-    ### 🌟 Emotion Analysis
-    - View emotion profiles across all stories
-    - Compare emotions by story groups (clusters)
-    - Analyze individual story emotions
-    - Interactive star plots and bar charts
-    """)
-    
-    st.markdown("""
-    ### 🎭 Story Groups
-    - Explore K-means clusters
-    - Visualize story groupings in 2D
-    - Compare emotion patterns across clusters
-    """)
+    st.html(_EXPLORE_LEFT_HTML)
 
 with col2:
-    st.markdown("""
-    ### 📖 Story Explorer
-    - Search and browse individual chapters
-    - View detailed emotion profiles
-    - Find similar stories
-    - Read story text previews
-    """)
-    
-    st.markdown("""
-    ### 📊 Text Insights
-    - Word clouds by cluster and emotion
-    - POS tag distribution
-    - Named entity recognition results
-    - Language pattern analysis
-    """)
+    st.html(_EXPLORE_RIGHT_HTML)
 
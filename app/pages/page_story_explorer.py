@@ -1,70 +1,79 @@
 """Story Explorer page for the Jataka Emotion Analysis app."""
 
 import streamlit as st
-import sys
-from pathlib import Path
 
-# Add src to path - handle both running from root and from app directory
-project_root = Path(__file__).parent.parent.parent
-src_path = project_root / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+import _bootstrap  # noqa: F401  (app/ is on sys.path as app.py's directory; adds src/)
 
 from utils.data_loader import (
-    load_stories, load_emotion_scores, load_cluster_assignments,
-    load_emotion_words_found, load_chapter_similarity
+    load_stories_by_chapter, load_emotion_scores,
+    get_cluster_assignment_map,
+    load_emotion_words_found, get_top_k_similar,
+    get_story_chapter_options, get_chapter_title_map, get_emotion_table, rows_for
 )
 from utils.emotion_scaling import get_scaling_description
 from visualization.star_plot import create_star_plot
 
-# Import components from app directory
-components_path = Path(__file__).parent.parent / "components"
-if str(components_path) not in sys.path:
-    sys.path.insert(0, str(components_path))
-from story_display import (
+# Components from the app/components package
+from components.story_display import (
     display_story_info, display_emotion_words, display_similar_stories
 )
 
-st.set_page_config(
-    page_title="Story Explorer - Jataka Emotion Analysis",
-    page_icon="📖",
-    layout="wide"
-)
+# Only configure the page when run standalone; the app.py router has
+# already called set_page_config before exec'ing this script
+if __name__ == "__main__":
+    st.set_page_config(
+        page_title="Story Explorer - Jataka Emotion Analysis",
+        page_icon="📖",
+        layout="wide"
+    )
 
-st.title("📖 Story Explorer")
+@st.fragment
+def _render_emotion_profile(emotion_data: dict, selected_chapter):
+    """
+    Plot controls and the chapter's emotion star plot.
+
+    Runs as a fragment, so changing the theme or score display reruns only
+    this block instead of reloading and redrawing the whole story.
+    """
+    col_theme, col_scaling = st.columns(2)
+
+    with col_theme:
+        plot_theme = st.selectbox(
+            "🎨 Plot Theme",
+            options=["light", "dark"],
+            format_func=lambda x: "☀️ Light" if x == "light" else "🌙 Dark",
+            key="story_explorer_global_theme"
+        )
 
-# Global controls for all plots on this page
-col_theme, col_scaling = st.columns(2)
+    with col_scaling:
+        scaling_method = st.selectbox(
+            "📊 Score Display",
+            options=["minmax", "baseline", "raw"],
+            format_func=lambda x: {
+                "minmax": "Highlight Differences (Min-Max)",
+                "baseline": "Above/Below Baseline",
+                "raw": "Raw Scores"
+            }[x],
+            index=0,  # Default to minmax
+            key="story_explorer_scaling"
+        )
 
-with col_theme:
-    plot_theme = st.selectbox(
-        "🎨 Plot Theme",
-        options=["light", "dark"],
-        format_func=lambda x: "☀️ Light" if x == "light" else "🌙 Dark",
-        key="story_explorer_global_theme"
-    )
+    # Show scaling method description
+    with st.expander("ℹ️ About Score Display Methods"):
+        st.markdown(get_scaling_description(scaling_method))
 
-with col_scaling:
-    scaling_method = st.selectbox(
-        "📊 Score Display",
-        options=["minmax", "baseline", "raw"],
-        format_func=lambda x: {
-            "minmax": "Highlight Differences (Min-Max)",
-            "baseline": "Above/Below Baseline",
-            "raw": "Raw Scores"
-        }[x],
-        index=0,  # Default to minmax
-        key="story_explorer_scaling"
+    fig = create_star_plot(
+        emotion_data,
+        f"Chapter {selected_chapter} Emotion Profile",
+        theme=plot_theme,
+        scaling=scaling_method
     )
+    st.plotly_chart(fig, use_container_width=True, key=f"explorer_chapter_{selected_chapter}_star")
 
-# Show scaling method description
-with st.expander("ℹ️ About Score Display Methods"):
-    st.markdown(get_scaling_description(scaling_method))
-
-st.markdown("---")
+st.title("📖 Story Explorer")
 
 try:
-    stories = load_stories()
+    stories = load_stories_by_chapter()
     emotion_scores = load_emotion_scores()
     
     if stories.empty or emotion_scores.empty:
@@ -72,32 +81,31 @@ try:
     else:
         # Get chapter options
         if 'chapter' in stories.columns:
-            chapters = sorted(stories['chapter'].unique())
+            chapters = get_story_chapter_options()
         elif 'chapter' in emotion_scores.columns:
             chapters = sorted(emotion_scores['chapter'].unique())
         else:
             chapters = list(range(1, len(stories) + 1))
         
-        # Create format function to show chapter with title
-        def format_chapter(chapter_num):
-            if 'title' in stories.columns:
-                story = stories[stories['chapter'] == chapter_num]
-                if not story.empty:
-                    title = story.iloc[0]['title']
-                    return f"Chapter {chapter_num} : {title}"
-            return f"Chapter {chapter_num}"
+        # "Chapter N : title" labels from the cached title map, so the
+        # selectbox format_func is a plain dict lookup
+        title_map = get_chapter_title_map()
+        chapter_labels = {
+            ch: f"Chapter {ch} : {title_map[ch]}" if title_map.get(ch) is not None else f"Chapter {ch}"
+            for ch in chapters
+        }
 
         selected_chapter = st.selectbox(
             "🔍 Select Chapter",
             chapters,
-            format_func=format_chapter
+            format_func=chapter_labels.get
         )
         
-        st.markdown("---")
+        st.divider()
         
         if selected_chapter:
             # Get story data
-            story_data = stories[stories['chapter'] == selected_chapter]
+            story_data = rows_for(stories, selected_chapter)
             
             if not story_data.empty:
                 # Chapter info
@@ -111,58 +119,37 @@ try:
                     text_col='text' if 'text' in story_data.columns else None
                 )
                 
-                st.markdown("---")
+                st.divider()
                 
-                # Emotion profile
-                chapter_emotions = emotion_scores[emotion_scores['chapter'] == selected_chapter]
+                # Emotion profile (one row of the cached chapter x emotion table)
+                emotion_table = get_emotion_table()
+                emotion_data = emotion_table.row(selected_chapter)
                 
-                if not chapter_emotions.empty:
+                if emotion_data is not None:
                     st.subheader("🌟 Emotion Profile")
 
-                    # Get emotion columns
-                    emotion_cols = [col for col in chapter_emotions.columns
-                                  if col.lower() in ['trust', 'joy', 'anger', 'anticipation',
-                                                    'fear', 'disgust', 'surprise', 'sadness']]
-
-                    if emotion_cols:
-                        emotion_data = {col: chapter_emotions[col].iloc[0]
-                                      for col in emotion_cols if col in chapter_emotions.columns}
-
-                        fig = create_star_plot(
-                            emotion_data,
-                            f"Chapter {selected_chapter} Emotion Profile",
-                            theme=plot_theme,
-                            scaling=scaling_method
-                        )
-                        st.plotly_chart(fig, use_container_width=True, key=f"explorer_chapter_{selected_chapter}_star")
+                    if emotion_table.emotions:
+                        _render_emotion_profile(emotion_data, selected_chapter)
                     else:
                         st.warning("Emotion data not found for this chapter.")
                 else:
                     st.warning("Emotion scores not available for this chapter.")
                 
-                st.markdown("---")
+                st.divider()
                 
-                # Cluster assignment
-                try:
-                    cluster_assignments = load_cluster_assignments()
-                    if not cluster_assignments.empty and 'chapter' in cluster_assignments.columns:
-                        cluster_data = cluster_assignments[
-                            cluster_assignments['chapter'] == selected_chapter
-                        ]
-                        if not cluster_data.empty and 'cluster' in cluster_data.columns:
-                            cluster_id = cluster_data['cluster'].iloc[0]
-                            st.info(f"📊 **Belongs to Cluster {cluster_id}**")
-                except:
-                    pass
+                # Cluster assignment (cached chapter -> cluster lookup)
+                cluster_id = get_cluster_assignment_map().get(selected_chapter)
+                if cluster_id is not None:
+                    st.info(f"📊 **Belongs to Cluster {cluster_id}**")
                 
-                st.markdown("---")
+                st.divider()
                 
                 # Emotion words found
                 try:
                     emotion_words = load_emotion_words_found()
                     if not emotion_words.empty:
                         display_emotion_words(emotion_words, selected_chapter)
-                        st.markdown("---")
+                        st.divider()
                 except FileNotFoundError:
                     pass
                 except Exception as e:
@@ -170,13 +157,12 @@ try:
                 
                 # Similar stories
                 try:
-                    similarity_df = load_chapter_similarity()
-                    if not similarity_df.empty:
+                    # Precomputed top-5 neighbours per chapter: one dict lookup
+                    top_similar = get_top_k_similar(5)
+                    if top_similar:
                         display_similar_stories(
-                            similarity_df,
-                            selected_chapter,
-                            stories,
-                            top_n=5
+                            top_similar.get(selected_chapter, []),
+                            title_map
                         )
                 except FileNotFoundError:
                     pass
@@ -1,27 +1,42 @@
 """Story Groups (Clusters) page for the Jataka Emotion Analysis app."""
 
 import streamlit as st
-import sys
-from pathlib import Path
 
-# Add src to path - handle both running from root and from app directory
-project_root = Path(__file__).parent.parent.parent
-src_path = project_root / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+import _bootstrap  # noqa: F401  (app/ is on sys.path as app.py's directory; adds src/)
 
 from utils.data_loader import (
     load_cluster_assignments, load_cluster_emotions, 
-    load_cluster_visualization, load_stories
+    load_cluster_visualization, load_stories, get_cluster_summary
 )
+from utils.config import EMOTION_SET
 from visualization.charts import create_cluster_pie_chart, create_emotion_bar_chart
 from visualization.scatter_plot import create_cluster_scatter_plot
 
-st.set_page_config(
-    page_title="Story Groups - Jataka Emotion Analysis",
-    page_icon="🎭",
-    layout="wide"
-)
+# Components from the app/components package
+from components.metrics_cards import render_metrics_grid
+
+# Only configure the page when run standalone; the app.py router has
+# already called set_page_config before exec'ing this script
+if __name__ == "__main__":
+    st.set_page_config(
+        page_title="Story Groups - Jataka Emotion Analysis",
+        page_icon="🎭",
+        layout="wide"
+    )
+
+# Static explanation as literal HTML (st.html skips per-rerun markdown parsing)
+_EXPLANATION_HTML = """
+<p>Story groups are clusters of similar Jataka tales created using <strong>K-means clustering</strong> on TF-IDF features.
+Stories within the same cluster share similar themes, vocabulary, or narrative patterns.</p>
+
+<p><strong>How it works:</strong></p>
+<ol>
+  <li>Text from each chapter is converted to TF-IDF vectors</li>
+  <li>K-means clustering groups similar stories together</li>
+  <li>Each cluster represents a distinct narrative pattern or theme</li>
+  <li>Emotion profiles can be compared across clusters to identify patterns</li>
+</ol>
+"""
 
 st.title("🎭 Story Groups (Clusters)")
 
@@ -33,22 +48,13 @@ plot_theme = st.selectbox(
     key="story_groups_global_theme"
 )
 
-st.markdown("---")
+st.divider()
 
 # Explanation
 st.header("📖 What are Story Groups?")
-st.markdown("""
-Story groups are clusters of similar Jataka tales created using **K-means clustering** on TF-IDF features.
-Stories within the same cluster share similar themes, vocabulary, or narrative patterns.
+st.html(_EXPLANATION_HTML)
 
-**How it works:**
-1. Text from each chapter is converted to TF-IDF vectors
-2. K-means clustering groups similar stories together
-3. Each cluster represents a distinct narrative pattern or theme
-4. Emotion profiles can be compared across clusters to identify patterns
-""")
-
-st.markdown("---")
+st.divider()
 
 try:
     cluster_assignments = load_cluster_assignments()
@@ -58,7 +64,8 @@ try:
         # Cluster distribution
         st.header("📊 Cluster Distribution")
         
-        cluster_counts = cluster_assignments['cluster'].value_counts().sort_index()
+        # Per-cluster counts (already in label order) and the sorted labels
+        cluster_counts, cluster_ids = get_cluster_summary()
         
         col1, col2 = st.columns(2)
         
@@ -68,16 +75,17 @@ try:
         
         with col2:
             st.subheader("Cluster Statistics")
-            for cluster_id in sorted(cluster_counts.index):
-                count = cluster_counts[cluster_id]
-                percentage = (count / len(cluster_assignments)) * 100
-                st.metric(
-                    label=f"Cluster {cluster_id}",
-                    value=f"{count} chapters",
-                    delta=f"{percentage:.1f}%"
-                )
+            # One HTML grid element for all clusters instead of one st.metric each
+            total = len(cluster_assignments)
+            render_metrics_grid(
+                [
+                    (f"Cluster {cluster_id}", f"{count} chapters", "", f"{count / total * 100:.1f}%")
+                    for cluster_id, count in cluster_counts.items()
+                ],
+                columns=1
+            )
         
-        st.markdown("---")
+        st.divider()
         
         # Interactive scatter plot
         st.header("🗺️ Interactive Cluster Visualization")
@@ -110,7 +118,7 @@ try:
         except Exception as e:
             st.warning(f"Could not load cluster visualization: {e}")
         
-        st.markdown("---")
+        st.divider()
         
         # Cluster comparison table
         st.header("📋 Cluster Comparison")
@@ -118,25 +126,30 @@ try:
         if not cluster_emotions.empty and 'cluster' in cluster_emotions.columns:
             # Get emotion columns
             emotion_cols = [col for col in cluster_emotions.columns 
-                          if col.lower() in ['trust', 'joy', 'anger', 'anticipation', 
-                                            'fear', 'disgust', 'surprise', 'sadness']]
+                          if col.lower() in EMOTION_SET]
             
             if emotion_cols:
-                # Create comparison table
-                comparison_data = []
-                for cluster_id in sorted(cluster_emotions['cluster'].unique()):
-                    cluster_data = cluster_emotions[cluster_emotions['cluster'] == cluster_id]
-                    if not cluster_data.empty:
-                        row = {'Cluster': f"Cluster {cluster_id}"}
-                        for emotion in emotion_cols:
-                            if emotion in cluster_data.columns:
-                                row[emotion.title()] = cluster_data[emotion].iloc[0]
-                        comparison_data.append(row)
+                # Create comparison table: one row per cluster (first row wins,
+                # as before), selected and renamed in a single vectorized pass
+                cluster_table = (
+                    cluster_emotions
+                    .drop_duplicates('cluster')
+                    .set_index('cluster')
+                    .sort_index()[emotion_cols]
+                )
+                cluster_labels = "Cluster " + cluster_table.index.astype(str)
                 
-                if comparison_data:
-                    import pandas as pd
-                    comparison_df = pd.DataFrame(comparison_data)
-                    st.dataframe(comparison_df, use_container_width=True)
+                if not cluster_table.empty:
+                    comparison_df = (
+                        cluster_table
+                        .rename(columns=str.title)
+                        .rename_axis('Cluster')
+                        .reset_index()
+                    )
+                    comparison_df['Cluster'] = cluster_labels
+                    # Collapsed by default and rounded: the chart below is the main view
+                    with st.expander("Show comparison table", expanded=False):
+                        st.dataframe(comparison_df.round(3), use_container_width=True)
                     
                     # Visual comparison
                     st.subheader("📊 Visual Comparison")
@@ -147,13 +160,9 @@ try:
                     
                     if selected_emotion:
                         emotion_lower = selected_emotion.lower()
-                        if emotion_lower in [e.lower() for e in emotion_cols]:
+                        if emotion_lower in cluster_table.columns:
                             # Get emotion values by cluster
-                            emotion_by_cluster = {}
-                            for cluster_id in sorted(cluster_emotions['cluster'].unique()):
-                                cluster_data = cluster_emotions[cluster_emotions['cluster'] == cluster_id]
-                                if not cluster_data.empty and emotion_lower in cluster_data.columns:
-                                    emotion_by_cluster[f"Cluster {cluster_id}"] = cluster_data[emotion_lower].iloc[0]
+                            emotion_by_cluster = dict(zip(cluster_labels, cluster_table[emotion_lower]))
                             
                             if emotion_by_cluster:
                                 fig = create_emotion_bar_chart(
@@ -167,15 +176,14 @@ try:
         else:
             st.warning("Cluster emotions data not available.")
         
-        st.markdown("---")
+        st.divider()
         
         # Select cluster to explore
         st.header("🔍 Explore a Cluster")
         
-        available_clusters = sorted(cluster_assignments['cluster'].unique())
         selected_cluster = st.selectbox(
             "Select a cluster to explore in detail",
-            available_clusters,
+            cluster_ids,
             format_func=lambda x: f"Cluster {x}"
         )
         
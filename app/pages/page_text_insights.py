@@ -1,39 +1,52 @@
 """Text Insights page for the Jataka Emotion Analysis app."""
 
+import heapq
+from io import BytesIO
+from operator import itemgetter
+
 import streamlit as st
-import sys
-from pathlib import Path
 
-# Add src to path - handle both running from root and from app directory
-project_root = Path(__file__).parent.parent.parent
-src_path = project_root / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+import _bootstrap  # noqa: F401  (app/ is on sys.path as app.py's directory; adds src/)
 
 from utils.data_loader import (
     load_word_frequencies, load_word_freq_by_cluster, load_word_freq_by_emotion,
-    load_word_freq_by_pos, load_word_freq_by_ner,
+    get_pos_word_index, get_ner_word_index,
     load_pos_distribution, load_pos_by_chapter, load_pos_by_cluster,
-    load_ner_entities, load_ner_by_chapter, load_ner_counts,
-    load_cluster_assignments
-)
-from visualization.charts import create_pos_distribution_chart, create_ner_distribution_chart
-import pandas as pd
-import base64
-from io import BytesIO
-from PIL import Image as PILImage
-
-try:
-    from streamlit_image_zoom import image_zoom
-    HAS_IMAGE_ZOOM = True
-except ImportError:
-    HAS_IMAGE_ZOOM = False
-
-st.set_page_config(
-    page_title="Text Insights - Jataka Emotion Analysis",
-    page_icon="📊",
-    layout="wide"
+    load_ner_entities, load_ner_by_chapter, load_ner_counts, load_text_statistics,
+    load_top_entities,
+    get_available_clusters, get_available_emotions,
+    load_top_words, get_top_words, get_prebuilt_wordcloud, TOP_WORDS_LIMIT
 )
+from visualization.wordcloud_gen import generate_wordcloud
+
+# Only configure the page when run standalone; the app.py router has
+# already called set_page_config before exec'ing this script
+if __name__ == "__main__":
+    st.set_page_config(
+        page_title="Text Insights - Jataka Emotion Analysis",
+        page_icon="📊",
+        layout="wide"
+    )
+
+# Selectbox labels, built once rather than as a dict literal on every rerun
+THEME_LABELS = {"light": "☀️ Light", "dark": "🌙 Dark"}
+FILTER_LABELS = {
+    "all": "All Words",
+    "noun": "Nouns Only",
+    "verb": "Verbs Only",
+    "adjective": "Adjectives Only",
+    "person": "Person Names",
+    "location": "Location Names"
+}
+# Word cloud title prefix per filter (the "all" filter has none)
+FILTER_TITLES = {
+    "noun": "Nouns",
+    "verb": "Verbs",
+    "adjective": "Adjectives",
+    "person": "Person Names",
+    "location": "Locations"
+}
+FILTER_PREFIXES = {key: f"{title} - " for key, title in FILTER_TITLES.items()}
 
 st.title("📊 Text Insights")
 
@@ -41,20 +54,44 @@ st.title("📊 Text Insights")
 plot_theme = st.selectbox(
     "🎨 Plot Theme (applies to all charts on this page)",
     options=["light", "dark"],
-    format_func=lambda x: "☀️ Light" if x == "light" else "🌙 Dark",
+    format_func=THEME_LABELS.__getitem__,
     key="text_insights_global_theme"
 )
 
-st.markdown("---")
+st.divider()
 
 # Helper functions
+def safe_load(loader, not_found_msg, error_msg, report=st.warning):
+    """
+    Call a data loader, reporting a missing file or load error on the page.
+
+    Args:
+        loader: Zero-argument loader from utils.data_loader
+        not_found_msg: Message shown with st.info when the data file is missing
+        error_msg: Prefix for the message shown when loading fails otherwise
+        report: Streamlit function used for that message
+
+    Returns:
+        The loaded DataFrame, or None if it could not be loaded
+    """
+    try:
+        return loader()
+    except FileNotFoundError:
+        st.info(not_found_msg)
+    except Exception as e:
+        report(f"{error_msg}: {e}")
+    return None
+
 def get_filtered_words(word_freq_df, filter_type, cluster=None, emotion=None):
     """
     Filter word frequencies based on POS tag or NER entity type.
 
+    Unfiltered ('all') word clouds use the precomputed top words instead
+    (see get_wordcloud_words).
+
     Args:
         word_freq_df: DataFrame with word frequencies (can include cluster/emotion column)
-        filter_type: One of 'all', 'noun', 'verb', 'adjective', 'person', 'location'
+        filter_type: One of 'noun', 'verb', 'adjective', 'person', 'location'
         cluster: Optional cluster number to filter by
         emotion: Optional emotion to filter by
 
@@ -69,13 +106,7 @@ def get_filtered_words(word_freq_df, filter_type, cluster=None, emotion=None):
     if emotion is not None and 'emotion' in word_freq_df.columns:
         word_freq_df = word_freq_df[word_freq_df['emotion'] == emotion]
 
-    if filter_type == "all":
-        # Return all words
-        word_col = 'word' if 'word' in word_freq_df.columns else word_freq_df.columns[0]
-        freq_col = 'frequency' if 'frequency' in word_freq_df.columns else word_freq_df.columns[1]
-        return dict(zip(word_freq_df[word_col], word_freq_df[freq_col]))
-
-    # For filtered types, we need to intersect specific words with POS/NER filtered words
+    # POS/NER words are intersected with the words of the selected cluster/emotion
     if cluster is not None or emotion is not None:
         # Get the word list from the filtered data
         word_col = 'word' if 'word' in word_freq_df.columns else word_freq_df.columns[0]
@@ -84,7 +115,7 @@ def get_filtered_words(word_freq_df, filter_type, cluster=None, emotion=None):
     # POS-based filters
     if filter_type in ["noun", "verb", "adjective"]:
         try:
-            word_freq_pos = load_word_freq_by_pos()
+            pos_index = get_pos_word_index()
 
             # Map filter to POS tags
             pos_tag_map = {
@@ -94,14 +125,13 @@ def get_filtered_words(word_freq_df, filter_type, cluster=None, emotion=None):
             }
             pos_tag = pos_tag_map[filter_type]
 
-            # Filter by POS tag
-            filtered = word_freq_pos[word_freq_pos['pos_tag'] == pos_tag]
+            # Words with this POS tag (shared cached dict - copied, never mutated)
+            words = pos_index.get(pos_tag, {})
 
             # If cluster/emotion is specified, intersect with those words
             if cluster is not None or emotion is not None:
-                filtered = filtered[filtered['word'].isin(specific_words)]
-
-            return dict(zip(filtered['word'], filtered['frequency']))
+                return {w: f for w, f in words.items() if w in specific_words}
+            return dict(words)
         except Exception as e:
             st.warning(f"Could not load POS-filtered words: {e}")
             return {}
@@ -109,7 +139,7 @@ def get_filtered_words(word_freq_df, filter_type, cluster=None, emotion=None):
     # NER-based filters
     if filter_type in ["person", "location"]:
         try:
-            word_freq_ner = load_word_freq_by_ner()
+            ner_index = get_ner_word_index()
 
             # Map filter to entity types
             entity_type_map = {
@@ -118,30 +148,213 @@ def get_filtered_words(word_freq_df, filter_type, cluster=None, emotion=None):
             }
             entity_type = entity_type_map[filter_type]
 
-            # Filter by entity type
-            filtered = word_freq_ner[word_freq_ner['entity_type'] == entity_type]
+            # Words of this entity type (shared cached dict - copied, never mutated)
+            words = ner_index.get(entity_type, {})
 
             # If cluster/emotion is specified, intersect with those words
             if cluster is not None or emotion is not None:
-                filtered = filtered[filtered['word'].isin(specific_words)]
-
-            return dict(zip(filtered['word'], filtered['frequency']))
+                return {w: f for w, f in words.items() if w in specific_words}
+            return dict(words)
         except Exception as e:
             st.warning(f"Could not load NER-filtered words: {e}")
             return {}
 
     return {}
 
-def display_wordcloud_image(img_base64: str):
-    """Display word cloud image with native Streamlit for sharp viewing."""
+# Full frequency table per word cloud scope, only needed for POS/NER filters
+_FULL_WORD_FREQ_LOADERS = {
+    'overall': load_word_frequencies,
+    'cluster': load_word_freq_by_cluster,
+    'emotion': load_word_freq_by_emotion,
+}
+
+# Keyed on the plain (filter, scope, group) arguments, so returning to a filter
+# or group seen before skips the POS/NER filtering and sort entirely
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_wordcloud_words(filter_type, scope, group=None):
+    """
+    Words for one word cloud as {word: frequency}, most frequent first.
+
+    Args:
+        filter_type: One of 'all', 'noun', 'verb', 'adjective', 'person', 'location'
+        scope: 'overall', 'cluster' or 'emotion'
+        group: Cluster number or emotion for the 'cluster'/'emotion' scopes
+
+    Returns:
+        Dictionary of at most TOP_WORDS_LIMIT words
+    """
+    if filter_type == "all":
+        # Precomputed top-100 table, so the full long-tail table is never loaded
+        return get_top_words(scope, group)
+
+    word_freq_df = _FULL_WORD_FREQ_LOADERS[scope]()
+    group_kwargs = {scope: group} if group is not None else {}
+    word_dict = get_filtered_words(word_freq_df, filter_type, **group_kwargs)
+    # Partial heap selection; same result (ties in input order) as a full sort + slice
+    return dict(heapq.nlargest(TOP_WORDS_LIMIT, word_dict.items(), key=itemgetter(1)))
+
+# Word cloud PNGs cached on (word/frequency pairs, theme, title), so returning to
+# a cluster, emotion or filter seen before skips font loading and rendering.
+# Bounded because each full-resolution PNG is a few MB.
+@st.cache_data(show_spinner="Rendering word cloud...", max_entries=32)
+def _cached_wordcloud(word_items: tuple, theme: str, title: str) -> bytes:
+    return generate_wordcloud(dict(word_items), theme=theme, title=title)
+
+# Distribution charts cached on their (small, static) data, title and theme, so a
+# rerun reuses the figure instead of rebuilding it. Plotly is imported on the
+# first build rather than at page load.
+@st.cache_data(show_spinner=False)
+def _cached_pos_chart(pos_dist, title: str, theme: str):
+    from visualization.charts import create_pos_distribution_chart
+    return create_pos_distribution_chart(pos_dist, title, theme=theme)
+
+@st.cache_data(show_spinner=False)
+def _cached_ner_chart(ner_counts, title: str, theme: str):
+    from visualization.charts import create_ner_distribution_chart
+    return create_ner_distribution_chart(ner_counts, title, theme=theme)
+
+@st.cache_data(show_spinner=False)
+def _cached_word_count_histogram(word_counts):
+    import plotly.express as px
+    return px.histogram(
+        word_counts,
+        x='total_words',
+        nbins=30,
+        title="Distribution of Word Count per Story",
+        labels={'total_words': 'Total Words', 'count': 'Number of Stories'}
+    )
+
+# Top POS tags overall and per noun/verb category from a single descending sort;
+# a stable sort keeps ties in file order, as nlargest does
+@st.cache_data(show_spinner=False)
+def _top_pos_tables(pos_dist, limit: int = 10):
+    ranked = pos_dist.sort_values('count', ascending=False, kind='stable')
+    by_category = ranked.groupby('category', observed=True).head(limit)
+    nouns = by_category[by_category['category'] == 'noun']
+    verbs = by_category[by_category['category'] == 'verb']
+    return tuple(_without_category(df) for df in (ranked.head(limit), nouns, verbs))
+
+def get_wordcloud_image(filter_type, scope, group, theme, title):
+    """
+    Word cloud image for one scope/group as a PNG path or PNG bytes.
+
+    Unfiltered clouds use the PNG prerendered by
+    process_data/prebuild_wordclouds.py when it is up to date; everything
+    else is rendered (and cached) on demand.
+
+    Returns:
+        Image path or PNG bytes, or None if there are no words to show
+    """
+    if filter_type == "all":
+        prebuilt = get_prebuilt_wordcloud(scope, group, theme)
+        if prebuilt is not None:
+            return str(prebuilt)
+
+    top_word_dict = get_wordcloud_words(filter_type, scope, group)
+    if not top_word_dict:
+        return None
+    return _cached_wordcloud(tuple(top_word_dict.items()), theme, title)
+
+# Preview width, and the width Streamlit scales stretched images down to
+# (twice its 730px content column)
+_PREVIEW_WIDTH = 600
+_FULL_VIEW_WIDTH = 1460
+
+# st.image decodes, resizes and re-encodes PNG bytes wider than it displays on
+# every rerun; resizing once here and caching the result makes it pass them through
+@st.cache_data(show_spinner=False, max_entries=64)
+def _resized_png(png: bytes, width: int) -> bytes:
+    from PIL import Image
+    image = Image.open(BytesIO(png))
+    if image.width <= width:
+        return png
+    height = int(image.height * width / image.width)
+    buf = BytesIO()
+    image.resize((width, height), resample=Image.BILINEAR).save(buf, format="PNG")
+    return buf.getvalue()
+
+def display_wordcloud_image(image):
+    """Display word cloud image (path or PNG bytes) with native Streamlit for sharp viewing."""
+    # Prerendered PNG files are served as-is, so both views share one file
+    preview = full = image
+    if isinstance(image, bytes):
+        preview = _resized_png(image, _PREVIEW_WIDTH)
+        full = _resized_png(image, _FULL_VIEW_WIDTH)
+
     # Display at small size by default (preview)
-    st.image(f"data:image/png;base64,{img_base64}", width=600, caption="Preview - Expand below to see full resolution")
+    st.image(preview, width=_PREVIEW_WIDTH, caption="Preview - Expand below to see full resolution")
 
     # Provide expander with full-scale image
     with st.expander("🔍 View Full Scale (3200x2400 @ 200 DPI)"):
-        st.image(f"data:image/png;base64,{img_base64}", use_container_width=True)
+        st.image(full, use_container_width=True)
         st.caption("💡 Tip: Right-click and 'Open image in new tab' for pixel-perfect zoom in your browser")
 
+def _without_category(df):
+    """Drop the loader's filtering-only ``category`` column before display."""
+    return df.drop(columns='category', errors='ignore')
+
+# Per-scope settings for the cluster and emotion word clouds
+_GROUP_WORDCLOUDS = {
+    'cluster': {
+        'label': "Select Cluster",
+        'groups': get_available_clusters,
+        'format': lambda cluster: f"Cluster {cluster}",
+        'title': lambda cluster: f"Cluster {cluster}",
+        'no_groups': "Word frequency by cluster data not available.",
+    },
+    'emotion': {
+        'label': "Select Emotion",
+        'groups': get_available_emotions,
+        'format': str.title,
+        'title': lambda emotion: f"{emotion.title()} Emotion",
+        'no_groups': "No emotion data available in word frequencies.",
+    },
+}
+
+@st.fragment
+def _render_group_wordcloud(scope: str, filter_option: str, theme_option: str):
+    """
+    Cluster or emotion picker and its word cloud.
+
+    Runs as a fragment, so picking another cluster or emotion reruns only
+    this block instead of the whole page (and the other tabs).
+
+    Args:
+        scope: 'cluster' or 'emotion' (a key of _GROUP_WORDCLOUDS)
+        filter_option: Word filter selected for the tab
+        theme_option: Word cloud theme selected for the tab
+    """
+    spec = _GROUP_WORDCLOUDS[scope]
+    try:
+        if load_top_words(scope).empty:
+            st.info(f"Word frequency by {scope} data not available.")
+            return
+
+        groups = spec['groups']()
+        if not groups:
+            st.info(spec['no_groups'])
+            return
+
+        selected = st.selectbox(
+            spec['label'], groups, format_func=spec['format'], key=f"{scope}_wordcloud"
+        )
+
+        # Word cloud of the top 100 words for this cluster or emotion
+        filter_label = FILTER_PREFIXES.get(filter_option, "")
+        image = get_wordcloud_image(
+            filter_option, scope, selected, theme_option,
+            f"{filter_label}{spec['title'](selected)}"
+        )
+
+        if image:
+            display_wordcloud_image(image)
+        else:
+            st.info(f"No {filter_option} words for {scope} {selected}.")
+    except FileNotFoundError:
+        st.info(f"📝 Word frequency by {scope} data not found.")
+    except Exception as e:
+        st.warning(f"Could not load word frequency by {scope}: {e}")
+
 # Create tabs
 tab1, tab2, tab3 = st.tabs(["☁️ Word Clouds", "📝 Language Patterns", "🏷️ Named Entities"])
 
@@ -155,15 +368,8 @@ with tab1:
     with col_filter:
         filter_option = st.selectbox(
             "🔍 Filter by",
-            options=["all", "noun", "verb", "adjective", "person", "location"],
-            format_func=lambda x: {
-                "all": "All Words",
-                "noun": "Nouns Only",
-                "verb": "Verbs Only",
-                "adjective": "Adjectives Only",
-                "person": "Person Names",
-                "location": "Location Names"
-            }[x],
+            options=list(FILTER_LABELS),
+            format_func=FILTER_LABELS.__getitem__,
             key="wordcloud_filter"
         )
 
@@ -171,137 +377,43 @@ with tab1:
         theme_option = st.selectbox(
             "🎨 Theme",
             options=["dark", "light"],
-            format_func=lambda x: "☀️ Light" if x == "light" else "🌙 Dark",
+            format_func=THEME_LABELS.__getitem__,
             key="wordcloud_theme"
         )
 
     try:
-        word_freq = load_word_frequencies()
+        word_freq = load_top_words('overall')
 
         if not word_freq.empty:
             # Overall word cloud
             st.subheader("Overall Word Cloud")
 
-            # Get filtered words based on selection
-            word_dict = get_filtered_words(word_freq, filter_option)
-
-            if word_dict:
-                # Limit to top 100 words
-                sorted_words = sorted(word_dict.items(), key=lambda x: x[1], reverse=True)[:100]
-                top_word_dict = dict(sorted_words)
-
-                # Generate word cloud with theme
-                from visualization.wordcloud_gen import generate_wordcloud
-                filter_label = {
-                    "all": "Overall",
-                    "noun": "Nouns",
-                    "verb": "Verbs",
-                    "adjective": "Adjectives",
-                    "person": "Person Names",
-                    "location": "Locations"
-                }[filter_option]
-                img_base64 = generate_wordcloud(top_word_dict, theme=theme_option, title=f"{filter_label} Word Cloud")
-                display_wordcloud_image(img_base64)
+            # Word cloud of the top 100 words for the selected filter and theme
+            filter_label = FILTER_TITLES.get(filter_option, "Overall")
+            image = get_wordcloud_image(
+                filter_option, 'overall', None, theme_option, f"{filter_label} Word Cloud"
+            )
+
+            if image:
+                display_wordcloud_image(image)
             else:
                 st.warning(f"No {filter_option} words available.")
         else:
             st.warning("Word frequencies data not available.")
         
-        st.markdown("---")
+        st.divider()
         
         # Word cloud by cluster
         st.subheader("Word Cloud by Cluster")
 
-        try:
-            word_freq_cluster = load_word_freq_by_cluster()
-            cluster_assignments = load_cluster_assignments()
-
-            if not word_freq_cluster.empty and not cluster_assignments.empty:
-                available_clusters = sorted(cluster_assignments['cluster'].unique())
-                selected_cluster = st.selectbox(
-                    "Select Cluster",
-                    available_clusters,
-                    format_func=lambda x: f"Cluster {x}",
-                    key="cluster_wordcloud"
-                )
-
-                # Get filtered words for this cluster
-                word_dict = get_filtered_words(word_freq_cluster, filter_option, cluster=selected_cluster)
-
-                if word_dict:
-                    # Limit to top 100 words
-                    sorted_words = sorted(word_dict.items(), key=lambda x: x[1], reverse=True)[:100]
-                    top_word_dict = dict(sorted_words)
-
-                    from visualization.wordcloud_gen import generate_wordcloud
-                    filter_label = {
-                        "all": "",
-                        "noun": "Nouns - ",
-                        "verb": "Verbs - ",
-                        "adjective": "Adjectives - ",
-                        "person": "Person Names - ",
-                        "location": "Locations - "
-                    }[filter_option]
-                    img_base64 = generate_wordcloud(top_word_dict, theme=theme_option, title=f"{filter_label}Cluster {selected_cluster}")
-                    display_wordcloud_image(img_base64)
-                else:
-                    st.info(f"No {filter_option} words for cluster {selected_cluster}.")
-            else:
-                st.info("Word frequency by cluster data not available.")
-        except FileNotFoundError:
-            st.info("📝 Word frequency by cluster data not found.")
-        except Exception as e:
-            st.warning(f"Could not load word frequency by cluster: {e}")
+        _render_group_wordcloud('cluster', filter_option, theme_option)
         
-        st.markdown("---")
+        st.divider()
         
         # Word cloud by emotion
         st.subheader("Word Cloud by Emotion")
 
-        try:
-            word_freq_emotion = load_word_freq_by_emotion()
-
-            if not word_freq_emotion.empty:
-                emotions = ['trust', 'joy', 'anger', 'anticipation', 'fear', 'disgust', 'surprise', 'sadness']
-                available_emotions = [e for e in emotions if e in word_freq_emotion.get('emotion', pd.Series()).values]
-
-                if available_emotions:
-                    selected_emotion = st.selectbox(
-                        "Select Emotion",
-                        available_emotions,
-                        format_func=lambda x: x.title(),
-                        key="emotion_wordcloud"
-                    )
-
-                    # Get filtered words for this emotion
-                    word_dict = get_filtered_words(word_freq_emotion, filter_option, emotion=selected_emotion)
-
-                    if word_dict:
-                        # Limit to top 100 words
-                        sorted_words = sorted(word_dict.items(), key=lambda x: x[1], reverse=True)[:100]
-                        top_word_dict = dict(sorted_words)
-
-                        from visualization.wordcloud_gen import generate_wordcloud
-                        filter_label = {
-                            "all": "",
-                            "noun": "Nouns - ",
-                            "verb": "Verbs - ",
-                            "adjective": "Adjectives - ",
-                            "person": "Person Names - ",
-                            "location": "Locations - "
-                        }[filter_option]
-                        img_base64 = generate_wordcloud(top_word_dict, theme=theme_option, title=f"{filter_label}{selected_emotion.title()} Emotion")
-                        display_wordcloud_image(img_base64)
-                    else:
-                        st.info(f"No {filter_option} words for emotion {selected_emotion}.")
-                else:
-                    st.info("No emotion data available in word frequencies.")
-            else:
-                st.info("Word frequency by emotion data not available.")
-        except FileNotFoundError:
-            st.info("📝 Word frequency by emotion data not found.")
-        except Exception as e:
-            st.warning(f"Could not load word frequency by emotion: {e}")
+        _render_group_wordcloud('emotion', filter_option, theme_option)
     except FileNotFoundError:
         st.info("📝 Word frequency data not found. Please generate the data files first.")
     except Exception as e:
@@ -314,92 +426,79 @@ with tab2:
     # POS distribution
     st.subheader("POS Tag Distribution")
     
-    try:
-        pos_dist = load_pos_distribution()
-        
-        if not pos_dist.empty:
-            fig = create_pos_distribution_chart(pos_dist, "POS Tag Distribution", theme=plot_theme)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Show top POS tags
-            if 'pos_tag' in pos_dist.columns and 'count' in pos_dist.columns:
-                top_pos = pos_dist.nlargest(10, 'count')
-                st.dataframe(top_pos, use_container_width=True)
-            else:
-                st.dataframe(pos_dist.head(20), use_container_width=True)
-        else:
-            st.warning("POS distribution data not available.")
-    except FileNotFoundError:
-        st.info("📝 POS distribution data not found.")
-    except Exception as e:
-        st.error(f"Error loading POS distribution: {e}")
-    
-    st.markdown("---")
-    
-    # Most common nouns/verbs
-    st.subheader("Most Common Nouns and Verbs")
+    # Loaded once and shared by both POS sections below
+    pos_dist = safe_load(
+        load_pos_distribution, "📝 POS distribution data not found.",
+        "Error loading POS distribution", report=st.error
+    )
     
-    try:
-        pos_dist = load_pos_distribution()
-        
-        if not pos_dist.empty:
-            # Try to identify nouns and verbs (common POS tags in Thai: N, V, etc.)
-            if 'pos_tag' in pos_dist.columns and 'count' in pos_dist.columns:
-                # Filter for nouns (common tags: N, NOUN, NN, etc.)
-                nouns = pos_dist[
-                    pos_dist['pos_tag'].str.contains('N|NOUN', case=False, na=False)
-                ].nlargest(10, 'count')
-                
-                # Filter for verbs (common tags: V, VERB, VB, etc.)
-                verbs = pos_dist[
-                    pos_dist['pos_tag'].str.contains('V|VERB', case=False, na=False)
-                ].nlargest(10, 'count')
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown("**Top Nouns**")
-                    if not nouns.empty:
-                        st.dataframe(nouns, use_container_width=True)
-                    else:
-                        st.info("No noun data available.")
+    if pos_dist is not None:
+        # Ranked once and shared by both sections
+        if {'pos_tag', 'count'} <= set(pos_dist.columns):
+            top_pos, nouns, verbs = _top_pos_tables(pos_dist)
+
+        try:
+            if not pos_dist.empty:
+                fig = _cached_pos_chart(pos_dist, "POS Tag Distribution", plot_theme)
+                st.plotly_chart(fig, use_container_width=True)
                 
-                with col2:
-                    st.markdown("**Top Verbs**")
-                    if not verbs.empty:
-                        st.dataframe(verbs, use_container_width=True)
-                    else:
-                        st.info("No verb data available.")
+                # Show top POS tags
+                if 'pos_tag' in pos_dist.columns and 'count' in pos_dist.columns:
+                    st.dataframe(top_pos, use_container_width=True)
+                else:
+                    st.dataframe(pos_dist.head(20), use_container_width=True)
             else:
-                st.info("POS tag structure not recognized. Showing raw data:")
-                st.dataframe(pos_dist.head(20), use_container_width=True)
-        else:
-            st.warning("POS distribution data not available.")
-    except FileNotFoundError:
-        st.info("📝 POS distribution data not found.")
-    except Exception as e:
-        st.warning(f"Could not load POS data: {e}")
+                st.warning("POS distribution data not available.")
+        except Exception as e:
+            st.error(f"Error loading POS distribution: {e}")
+        
+        st.divider()
+        
+        # Most common nouns/verbs
+        st.subheader("Most Common Nouns and Verbs")
+        
+        try:
+            if not pos_dist.empty:
+                # Try to identify nouns and verbs (common POS tags in Thai: N, V, etc.)
+                if 'pos_tag' in pos_dist.columns and 'count' in pos_dist.columns:
+                    # nouns/verbs: top tags of the loader's noun/verb category
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.markdown("**Top Nouns**")
+                        if not nouns.empty:
+                            st.dataframe(nouns, use_container_width=True)
+                        else:
+                            st.info("No noun data available.")
+                    
+                    with col2:
+                        st.markdown("**Top Verbs**")
+                        if not verbs.empty:
+                            st.dataframe(verbs, use_container_width=True)
+                        else:
+                            st.info("No verb data available.")
+                else:
+                    st.info("POS tag structure not recognized. Showing raw data:")
+                    st.dataframe(pos_dist.head(20), use_container_width=True)
+            else:
+                st.warning("POS distribution data not available.")
+        except Exception as e:
+            st.warning(f"Could not load POS data: {e}")
     
-    st.markdown("---")
+    st.divider()
 
     # Word count distribution
     st.subheader("Word Count Distribution")
 
-    try:
-        from utils.data_loader import load_text_statistics
-        text_stats = load_text_statistics()
+    text_stats = safe_load(
+        load_text_statistics, "📝 Text statistics data not found.",
+        "Could not load text statistics"
+    )
 
+    if text_stats is not None:
         if not text_stats.empty:
             if 'total_words' in text_stats.columns:
-                import plotly.express as px
-
-                fig = px.histogram(
-                    text_stats,
-                    x='total_words',
-                    nbins=30,
-                    title="Distribution of Word Count per Story",
-                    labels={'total_words': 'Total Words', 'count': 'Number of Stories'}
-                )
+                fig = _cached_word_count_histogram(text_stats[['total_words']])
                 st.plotly_chart(fig, use_container_width=True)
 
                 # Show statistics
@@ -414,10 +513,6 @@ with tab2:
                 st.info("Word count data not available in text statistics.")
         else:
             st.warning("Text statistics data not available.")
-    except FileNotFoundError:
-        st.info("📝 Text statistics data not found.")
-    except Exception as e:
-        st.warning(f"Could not load text statistics: {e}")
 
 # Tab 3: Named Entities
 with tab3:
@@ -426,92 +521,68 @@ with tab3:
     # People mentioned
     st.subheader("People Mentioned")
     
-    try:
-        ner_entities = load_ner_entities()
-        ner_counts = load_ner_counts()
-        
-        if not ner_entities.empty:
-            # Filter for person entities
-            if 'entity_type' in ner_entities.columns:
-                people = ner_entities[ner_entities['entity_type'].str.contains('PERSON|คน|บุคคล', case=False, na=False)]
-                
-                if not people.empty:
-                    if 'entity' in people.columns and 'count' in people.columns:
-                        top_people = people.nlargest(20, 'count')
+    # Loaded once and shared by the People and Places sections below
+    ner_entities = safe_load(
+        load_ner_entities, "📝 NER entities data not found.", "Could not load NER entities"
+    )
+    
+    if ner_entities is not None:
+        try:
+            if not ner_entities.empty:
+                if {'entity', 'entity_type'} <= set(ner_entities.columns):
+                    # Precomputed top 20 people (mentions summed over chapters)
+                    top_people = load_top_entities('person')
+
+                    if not top_people.empty:
                         st.dataframe(top_people, use_container_width=True)
-                    elif 'entity' in people.columns:
-                        entity_counts = people['entity'].value_counts().head(20)
-                        st.dataframe(pd.DataFrame({
-                            'Entity': entity_counts.index,
-                            'Count': entity_counts.values
-                        }), use_container_width=True)
                     else:
-                        st.dataframe(people.head(20), use_container_width=True)
+                        st.info("No person entities found.")
                 else:
-                    st.info("No person entities found.")
+                    st.info("Entity type information not available. Showing all entities:")
+                    st.dataframe(ner_entities.head(20), use_container_width=True)
             else:
-                st.info("Entity type information not available. Showing all entities:")
-                st.dataframe(ner_entities.head(20), use_container_width=True)
-        else:
-            st.warning("NER entities data not available.")
-    except FileNotFoundError:
-        st.info("📝 NER entities data not found.")
-    except Exception as e:
-        st.warning(f"Could not load NER entities: {e}")
-    
-    st.markdown("---")
-    
-    # Places mentioned
-    st.subheader("Places Mentioned")
-    
-    try:
-        ner_entities = load_ner_entities()
+                st.warning("NER entities data not available.")
+        except Exception as e:
+            st.warning(f"Could not load NER entities: {e}")
         
-        if not ner_entities.empty:
-            if 'entity_type' in ner_entities.columns:
-                places = ner_entities[ner_entities['entity_type'].str.contains('LOC|PLACE|สถานที่|สถานที่', case=False, na=False)]
-                
-                if not places.empty:
-                    if 'entity' in places.columns and 'count' in places.columns:
-                        top_places = places.nlargest(20, 'count')
+        st.divider()
+        
+        # Places mentioned
+        st.subheader("Places Mentioned")
+        
+        try:
+            if not ner_entities.empty:
+                if {'entity', 'entity_type'} <= set(ner_entities.columns):
+                    # Precomputed top 20 places (mentions summed over chapters)
+                    top_places = load_top_entities('place')
+
+                    if not top_places.empty:
                         st.dataframe(top_places, use_container_width=True)
-                    elif 'entity' in places.columns:
-                        entity_counts = places['entity'].value_counts().head(20)
-                        st.dataframe(pd.DataFrame({
-                            'Entity': entity_counts.index,
-                            'Count': entity_counts.values
-                        }), use_container_width=True)
                     else:
-                        st.dataframe(places.head(20), use_container_width=True)
+                        st.info("No place entities found.")
                 else:
-                    st.info("No place entities found.")
+                    st.info("Entity type information not available.")
             else:
-                st.info("Entity type information not available.")
-        else:
-            st.warning("NER entities data not available.")
-    except FileNotFoundError:
-        st.info("📝 NER entities data not found.")
-    except Exception as e:
-        st.warning(f"Could not load NER entities: {e}")
+                st.warning("NER entities data not available.")
+        except Exception as e:
+            st.warning(f"Could not load NER entities: {e}")
     
-    st.markdown("---")
+    st.divider()
     
     # Entity distribution chart
     st.subheader("Entity Type Distribution")
     
-    try:
-        ner_counts = load_ner_counts()
-        
+    ner_counts = safe_load(
+        load_ner_counts, "📝 NER counts data not found.", "Could not load NER counts"
+    )
+
+    if ner_counts is not None:
         if not ner_counts.empty:
-            fig = create_ner_distribution_chart(ner_counts, "NER Entity Distribution", theme=plot_theme)
+            fig = _cached_ner_chart(ner_counts, "NER Entity Distribution", plot_theme)
             st.plotly_chart(fig, use_container_width=True)
             
             # Show table
             st.dataframe(ner_counts, use_container_width=True)
         else:
             st.warning("NER counts data not available.")
-    except FileNotFoundError:
-        st.info("📝 NER counts data not found.")
-    except Exception as e:
-        st.warning(f"Could not load NER counts: {e}")
 
@@ -24,6 +24,9 @@ import pandas as pd
 from pathlib import Path
 from collections import defaultdict, Counter
 
+# Whole token made of Thai characters; compiled once for the per-token loops
+_THAI_MATCH = re.compile(r'[\u0E00-\u0E7F]+$').match
+
 
 class TokenPosNerConverter:
     """Convert token_pos_ner.json to analysis CSV files."""
@@ -48,6 +51,9 @@ class TokenPosNerConverter:
         self.story_titles = list(self.data.keys())
         self.title_to_chapter = {title: idx + 1 for idx, title in enumerate(self.story_titles)}
 
+        # Story title -> BIO entities, filled on first use (see entities_by_title)
+        self._entities_by_title = None
+
     def extract_entities_from_bio(self, tokens):
         """
         Extract named entities from BIO-tagged tokens.
@@ -91,13 +97,27 @@ class TokenPosNerConverter:
 
         return entities
 
+    def entities_by_title(self):
+        """
+        Named entities of every story, extracted once for all NER outputs.
+
+        Returns:
+            Dict of story title -> list of (entity_text, entity_type) tuples,
+            in story order
+        """
+        if self._entities_by_title is None:
+            self._entities_by_title = {
+                title: self.extract_entities_from_bio(tokens)
+                for title, tokens in self.data.items()
+            }
+        return self._entities_by_title
+
     def generate_ner_entities(self):
         """Generate ner_entities.csv: chapter, entity, entity_type, count"""
         data_rows = []
 
-        for title, tokens in self.data.items():
+        for title, entities in self.entities_by_title().items():
             chapter = self.title_to_chapter[title]
-            entities = self.extract_entities_from_bio(tokens)
 
             # Count entities
             entity_counts = Counter(entities)
@@ -119,9 +139,8 @@ class TokenPosNerConverter:
         """Generate ner_by_chapter.csv: chapter, entity_type, count"""
         data_rows = []
 
-        for title, tokens in self.data.items():
+        for title, entities in self.entities_by_title().items():
             chapter = self.title_to_chapter[title]
-            entities = self.extract_entities_from_bio(tokens)
 
             # Count entity types
             type_counts = Counter(entity_type for _, entity_type in entities)
@@ -142,8 +161,7 @@ class TokenPosNerConverter:
         """Generate ner_counts.csv: entity_type, count, percentage"""
         all_entities = []
 
-        for title, tokens in self.data.items():
-            entities = self.extract_entities_from_bio(tokens)
+        for entities in self.entities_by_title().values():
             all_entities.extend(entity_type for _, entity_type in entities)
 
         type_counts = Counter(all_entities)
@@ -219,7 +237,7 @@ class TokenPosNerConverter:
         for title, tokens in self.data.items():
             for token, pos_tag, ner_tag in tokens:
                 # Keep only Thai characters
-                if re.match(r'^[\u0E00-\u0E7F]+$', token):
+                if _THAI_MATCH(token):
                     all_tokens.append(token)
 
         # Count token frequencies
@@ -261,7 +279,7 @@ class TokenPosNerConverter:
             if cluster is not None:
                 for token, pos_tag, ner_tag in tokens:
                     # Keep only Thai characters
-                    if re.match(r'^[\u0E00-\u0E7F]+$', token):
+                    if _THAI_MATCH(token):
                         cluster_tokens[cluster].append(token)
 
         # Count frequencies per cluster
@@ -312,7 +330,7 @@ class TokenPosNerConverter:
             if emotion is not None:
                 for token, pos_tag, ner_tag in tokens:
                     # Keep only Thai characters
-                    if re.match(r'^[\u0E00-\u0E7F]+$', token):
+                    if _THAI_MATCH(token):
                         emotion_tokens[emotion].append(token)
 
         # Count frequencies per emotion
@@ -340,7 +358,7 @@ class TokenPosNerConverter:
         for title, tokens in self.data.items():
             for token, pos_tag, ner_tag in tokens:
                 # Keep only Thai characters
-                if re.match(r'^[\u0E00-\u0E7F]+$', token):
+                if _THAI_MATCH(token):
                     pos_tokens[pos_tag].append(token)
 
         # Count frequencies per POS tag
@@ -365,9 +383,7 @@ class TokenPosNerConverter:
         # Collect entity tokens by NER type
         ner_tokens = defaultdict(list)
 
-        for title, tokens in self.data.items():
-            entities = self.extract_entities_from_bio(tokens)
-
+        for entities in self.entities_by_title().values():
             for entity_text, entity_type in entities:
                 # Entity text is already concatenated Thai text
                 if entity_text:
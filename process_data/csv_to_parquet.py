@@ -0,0 +1,48 @@
+"""
+Convert the CSV data files to Parquet.
+
+load_csv reads ``<name>.parquet`` instead of ``<name>.csv`` when the Parquet
+copy exists, is at least as new as the CSV and pyarrow is installed. Parquet
+is columnar, typed and compressed, so the app skips CSV parsing and dtype
+inference on every cold load. The CSV files stay the source of truth: re-run
+this script after regenerating them.
+
+Requires pyarrow. Output: data/*.parquet and data/mockup/*.parquet
+"""
+
+import pandas as pd
+from pathlib import Path
+
+
+def convert_directory(data_dir: Path, compression: str = 'zstd'):
+    """
+    Write a Parquet copy of every CSV file in a directory.
+
+    Args:
+        data_dir: Directory containing the CSV files
+        compression: Parquet compression codec
+    """
+    for csv_path in sorted(data_dir.glob('*.csv')):
+        parquet_path = csv_path.with_suffix('.parquet')
+        df = pd.read_csv(csv_path)
+        df.to_parquet(parquet_path, engine='pyarrow', compression=compression, index=False)
+
+        csv_kb = csv_path.stat().st_size / 1024
+        parquet_kb = parquet_path.stat().st_size / 1024
+        print(f"✓ {parquet_path.name} ({csv_kb:.0f} KB -> {parquet_kb:.0f} KB)")
+
+
+def main():
+    """Main entry point."""
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    data_dir = project_root / 'data'
+    for directory in (data_dir, data_dir / 'mockup'):
+        if directory.exists():
+            print(f"Converting {directory}...")
+            convert_directory(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Generate the most-mentioned people and places from ner_entities.csv.
+
+The Text Insights page shows the 20 most frequent person and place
+entities. ner_entities.csv has one row per chapter and entity, so the
+counts are summed per entity here once instead of on every interaction:
+
+1. ner_top_people.csv - entity, count
+2. ner_top_places.csv - entity, count
+
+Input: data/ner_entities.csv (from convert_token_pos_ner.py)
+Output: data/ner_top_*.csv
+"""
+
+import sys
+import pandas as pd
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from utils.config import ENTITY_CATEGORIES  # noqa: E402
+
+# Number of entities kept per table
+TOP_N = 20
+
+# (entity category, output file)
+OUTPUTS = [
+    ('person', 'ner_top_people.csv'),
+    ('place', 'ner_top_places.csv'),
+]
+
+
+def top_entities(df: pd.DataFrame, category: str, top_n: int = TOP_N) -> pd.DataFrame:
+    """
+    Most mentioned entities of one category.
+
+    Args:
+        df: NER entities with entity, entity_type and (optionally) count columns
+        category: Entity category from ENTITY_CATEGORIES ('person', 'place', ...)
+        top_n: Number of entities to keep
+
+    Returns:
+        DataFrame with columns entity, count sorted by descending count
+    """
+    types = df['entity_type'].astype(str).str.strip().str.upper()
+    matches = df[types.map(ENTITY_CATEGORIES) == category]
+    if 'count' in matches.columns:
+        counts = matches.groupby('entity', sort=False)['count'].sum()
+    else:
+        counts = matches['entity'].value_counts(sort=False)
+    counts = counts.sort_values(ascending=False, kind='stable').head(top_n)
+    return counts.rename('count').rename_axis('entity').reset_index()
+
+
+def generate_ner_top_entities(data_dir: Path, output_dir: Path):
+    """
+    Write the top people and places tables.
+
+    Args:
+        data_dir: Directory containing ner_entities.csv
+        output_dir: Directory to save output CSV files
+    """
+    input_path = data_dir / 'ner_entities.csv'
+    if not input_path.exists():
+        print(f"⚠ Skipping - {input_path} not found")
+        return
+
+    df = pd.read_csv(input_path)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for category, output_name in OUTPUTS:
+        top = top_entities(df, category)
+        top.to_csv(output_dir / output_name, index=False)
+        print(f"✓ Generated {output_name} ({len(top)} rows)")
+
+
+def main():
+    """Main entry point."""
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    data_dir = project_root / 'data'
+    generate_ner_top_entities(data_dir, data_dir)
+
+
+if __name__ == '__main__':
+    main()
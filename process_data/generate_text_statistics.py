@@ -14,6 +14,9 @@ import pandas as pd
 from pathlib import Path
 from collections import Counter
 
+# Thai-only token check, compiled once rather than looked up per token
+_THAI_MATCH = re.compile(r'[\u0E00-\u0E7F]+$').match
+
 
 def generate_text_statistics(input_path: Path, output_dir: Path):
     """
@@ -42,7 +45,7 @@ def generate_text_statistics(input_path: Path, output_dir: Path):
         # Extract Thai tokens only
         thai_tokens = []
         for token, pos_tag, ner_tag in tokens:
-            if re.match(r'^[\u0E00-\u0E7F]+$', token):
+            if _THAI_MATCH(token):
                 thai_tokens.append(token)
 
         # Calculate statistics
@@ -0,0 +1,88 @@
+"""
+Generate precomputed top-word tables for the word clouds.
+
+The Text Insights page only ever shows the 100 most frequent words of a
+word cloud, so those slices are written once here instead of being ranked
+on every interaction:
+
+1. top_words_overall.csv - word, frequency, rank
+2. top_words_by_cluster.csv - cluster, word, frequency, rank
+3. top_words_by_emotion.csv - emotion, word, frequency, rank
+
+Inputs are the word_frequencies*.csv files produced by
+convert_token_pos_ner.py. Output: data/top_words_*.csv
+"""
+
+import pandas as pd
+from pathlib import Path
+
+# Number of words kept per word cloud
+TOP_N = 100
+
+# (input file, output file, group column or None for the overall table)
+SOURCES = [
+    ('word_frequencies.csv', 'top_words_overall.csv', None),
+    ('word_freq_by_cluster.csv', 'top_words_by_cluster.csv', 'cluster'),
+    ('word_freq_by_emotion.csv', 'top_words_by_emotion.csv', 'emotion'),
+]
+
+
+def top_words(df: pd.DataFrame, group_col=None, top_n: int = TOP_N) -> pd.DataFrame:
+    """
+    Keep the ``top_n`` most frequent words (per group, if given).
+
+    Args:
+        df: DataFrame with word and frequency columns (plus ``group_col``)
+        group_col: Optional column to rank within
+        top_n: Number of words to keep per group
+
+    Returns:
+        DataFrame sorted by group then descending frequency, with a 1-based rank
+    """
+    # A repeated word counts once, with its last frequency; the stable sort
+    # keeps the input order for equal frequencies
+    df = df.drop_duplicates([group_col, 'word'] if group_col else 'word', keep='last')
+    if group_col:
+        df = df.sort_values([group_col, 'frequency'], ascending=[True, False], kind='stable')
+        df = df.groupby(group_col, sort=False).head(top_n).copy()
+        df['rank'] = df.groupby(group_col, sort=False).cumcount() + 1
+        columns = [group_col, 'word', 'frequency', 'rank']
+    else:
+        df = df.sort_values('frequency', ascending=False, kind='stable').head(top_n).copy()
+        df['rank'] = range(1, len(df) + 1)
+        columns = ['word', 'frequency', 'rank']
+    return df[columns].reset_index(drop=True)
+
+
+def generate_top_words(data_dir: Path, output_dir: Path):
+    """
+    Write the top-word tables for every available frequency file.
+
+    Args:
+        data_dir: Directory containing the word_frequencies*.csv files
+        output_dir: Directory to save output CSV files
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    for input_name, output_name, group_col in SOURCES:
+        input_path = data_dir / input_name
+        if not input_path.exists():
+            print(f"⚠ Skipping {output_name} - {input_path} not found")
+            continue
+
+        df = top_words(pd.read_csv(input_path), group_col)
+        df.to_csv(output_dir / output_name, index=False)
+        print(f"✓ Generated {output_name} ({len(df)} rows)")
+
+
+def main():
+    """Main entry point."""
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    data_dir = project_root / 'data'
+    generate_top_words(data_dir, data_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Prerender the unfiltered word clouds as PNG files.
+
+Rendering a word cloud is the most expensive thing the Text Insights page
+does. The "All Words" clouds only depend on the top-word tables, so they
+are rendered here once per theme and the page shows the PNG instead:
+
+1. wordclouds/<theme>/overall.png
+2. wordclouds/<theme>/cluster_<id>.png
+3. wordclouds/<theme>/emotion_<name>.png
+
+Images are written next to the word frequency files they come from
+(data/ and data/mockup/). The page only uses an image that is at least as
+new as its source file, so re-run this script after regenerating the data.
+
+Input: top_words_*.csv from generate_top_words.py, or the full
+word_frequencies*.csv files when those have not been generated.
+"""
+
+import sys
+import pandas as pd
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from generate_top_words import SOURCES, top_words  # noqa: E402
+from utils.config import get_wordcloud_path  # noqa: E402
+from visualization.wordcloud_gen import generate_wordcloud  # noqa: E402
+
+# Word cloud themes offered by the page
+THEMES = ('dark', 'light')
+
+# Group column -> word cloud scope
+SCOPES = {None: 'overall', 'cluster': 'cluster', 'emotion': 'emotion'}
+
+
+def wordcloud_title(scope: str, group=None) -> str:
+    """Title drawn on an unfiltered word cloud (matches the page)."""
+    if scope == 'overall':
+        return "Overall Word Cloud"
+    if scope == 'cluster':
+        return f"Cluster {group}"
+    return f"{str(group).title()} Emotion"
+
+
+def load_top_words(data_dir: Path, full_name: str, top_name: str, group_col=None):
+    """Top-word table from ``data_dir``, ranked from the full table if needed."""
+    top_path, full_path = data_dir / top_name, data_dir / full_name
+    # Like the app, ignore a top-word file older than its full table
+    if top_path.exists() and (not full_path.exists()
+                              or top_path.stat().st_mtime >= full_path.stat().st_mtime):
+        return pd.read_csv(top_path), top_path
+    if full_path.exists():
+        return top_words(pd.read_csv(full_path), group_col), full_path
+    return None, None
+
+
+def prebuild_wordclouds(data_dir: Path):
+    """
+    Render every unfiltered word cloud for the frequency files in a directory.
+
+    Args:
+        data_dir: Directory containing the word frequency files
+    """
+    for full_name, top_name, group_col in SOURCES:
+        df, source = load_top_words(data_dir, full_name, top_name, group_col)
+        if df is None:
+            print(f"⚠ Skipping {top_name} - no word frequency file in {data_dir}")
+            continue
+
+        scope = SCOPES[group_col]
+        groups = df.groupby(group_col, sort=True) if group_col else [(None, df)]
+        for group, words in groups:
+            word_freq = words.set_index('word')['frequency'].to_dict()
+            for theme in THEMES:
+                path = get_wordcloud_path(data_dir, scope, group, theme)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                png = generate_wordcloud(word_freq, theme=theme, title=wordcloud_title(scope, group))
+                path.write_bytes(png)
+                print(f"✓ {path.relative_to(data_dir)} (from {source.name})")
+
+
+def main():
+    """Main entry point."""
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    data_dir = project_root / 'data'
+    for directory in (data_dir, data_dir / 'mockup'):
+        if directory.exists():
+            print(f"Rendering word clouds for {directory}...")
+            prebuild_wordclouds(directory)
+
+
+if __name__ == '__main__':
+    main()
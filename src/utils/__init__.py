@@ -1,2 +1,13 @@
 """Utility modules for data loading and configuration."""
 
+__all__ = ["get_dataset_stats"]
+
+
+def __getattr__(name):
+    # Defer importing data_loader (and pandas with it) until a caller
+    # actually asks for the stats helper.
+    if name == "get_dataset_stats":
+        from .data_loader import get_dataset_stats
+        globals()[name] = get_dataset_stats
+        return get_dataset_stats
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -47,6 +47,24 @@ EMOTIONS = [
     "sadness"
 ]
 
+# Canonical display order and an O(1) lookup set for picking emotion columns
+EMOTION_ORDER = tuple(EMOTIONS)
+EMOTION_SET = frozenset(EMOTIONS)
+
+# Tag -> coarse category for the POS tables (UD and short Thai tag sets);
+# unlisted tags are 'other'
+POS_CATEGORIES = {
+    'NOUN': 'noun', 'PROPN': 'noun', 'N': 'noun', 'NN': 'noun',
+    'VERB': 'verb', 'V': 'verb', 'VB': 'verb',
+}
+
+# Entity type -> coarse category for the NER tables; unlisted types are 'other'
+ENTITY_CATEGORIES = {
+    'PERSON': 'person', 'PER': 'person', 'คน': 'person', 'บุคคล': 'person',
+    'LOCATION': 'place', 'LOC': 'place', 'PLACE': 'place', 'สถานที่': 'place',
+    'ORGANIZATION': 'org', 'ORG': 'org',
+}
+
 # Data file paths
 def get_data_path(filename: str, mode: Optional[str] = None) -> Path:
     """
@@ -77,3 +95,18 @@ def get_data_path(filename: str, mode: Optional[str] = None) -> Path:
     # Default to real data
     return DATA_DIR / filename
 
+# Prerendered word cloud PNGs (process_data/prebuild_wordclouds.py)
+WORDCLOUD_DIRNAME = "wordclouds"
+
+def get_wordcloud_path(data_dir: Path, scope: str, group=None, theme: str = "light") -> Path:
+    """
+    Path of a prerendered word cloud inside a data directory.
+
+    Args:
+        data_dir: Directory holding the word frequency files the cloud was built from
+        scope: 'overall', 'cluster' or 'emotion'
+        group: Cluster label or emotion name (ignored for 'overall')
+        theme: Word cloud theme ("light" or "dark")
+    """
+    name = "overall" if scope == "overall" else f"{scope}_{group}"
+    return data_dir / WORDCLOUD_DIRNAME / theme / f"{name}.png"
@@ -1,14 +1,30 @@
 """Data loading utilities for CSV files."""
 
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict, Any
+import streamlit as st
+from typing import Optional, Dict, Any, List, Tuple
 from .config import (
     get_data_path,
-    EMOTIONS,
+    get_wordcloud_path,
+    EMOTION_ORDER,
+    EMOTION_SET,
+    POS_CATEGORIES,
+    ENTITY_CATEGORIES,
     DATA_MODE,
 )
 
 
+try:
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
 def _resolve_mode(mode: Optional[str] = None) -> str:
     if mode:
         return mode.lower()
@@ -28,6 +44,9 @@ def load_csv(filename: str, mode: Optional[str] = None, **kwargs) -> pd.DataFram
     filepath = get_data_path(filename, mode=resolved_mode)
 
     if filepath.exists():
+        parquet = _read_parquet_copy(filepath, kwargs)
+        if parquet is not None:
+            return parquet
         return pd.read_csv(filepath, **kwargs)
 
     if resolved_mode == "adaptive":
@@ -41,10 +60,45 @@ def load_csv(filename: str, mode: Optional[str] = None, **kwargs) -> pd.DataFram
 
     raise FileNotFoundError(f"Data file not found: {filepath}")
 
+def _read_parquet_copy(csv_path, kwargs: Dict[str, Any]) -> Optional[pd.DataFrame]:
+    """
+    Read the Parquet copy of a CSV file (see process_data/csv_to_parquet.py).
+
+    Returns None, so the caller reads the CSV, when pyarrow is missing, the
+    copy is absent or older than the CSV, or ``kwargs`` holds read_csv
+    options other than ``usecols``.
+    """
+    parquet_path = csv_path.with_suffix('.parquet')
+    if (not HAS_PYARROW or set(kwargs) - {'usecols'} or not parquet_path.exists()
+            or parquet_path.stat().st_mtime < csv_path.stat().st_mtime):
+        return None
+
+    columns = kwargs.get('usecols')
+    if callable(columns):
+        columns = [col for col in pq.read_schema(parquet_path).names if columns(col)]
+    return pd.read_parquet(parquet_path, columns=columns)
+
+def _fresh_derived_file(derived: str, source: str) -> Optional[Path]:
+    """
+    Path of a precomputed data file, if it is up to date.
+
+    Returns None, so the caller derives the data from ``source`` itself,
+    when the file is missing or older than the source file it is built from.
+    """
+    derived_path = get_data_path(derived)
+    if not derived_path.exists():
+        return None
+    source_path = get_data_path(source)
+    if source_path.exists() and source_path.stat().st_mtime > derived_path.stat().st_mtime:
+        return None
+    return derived_path
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_stories() -> pd.DataFrame:
     """Load the jataka stories dataset."""
     return load_csv("jataka_stories.csv")
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_emotion_scores() -> pd.DataFrame:
     """
     Load emotion scores for all chapters from chapter_emotions.csv.
@@ -77,6 +131,7 @@ def load_emotion_scores() -> pd.DataFrame:
 
     return df
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_cluster_assignments() -> pd.DataFrame:
     """
     Load cluster assignments for chapters from wangchan_cluster.csv.
@@ -99,6 +154,7 @@ def load_cluster_assignments() -> pd.DataFrame:
 
     return df
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_cluster_emotions() -> pd.DataFrame:
     """
     Load emotion statistics by cluster.
@@ -117,74 +173,471 @@ def load_cluster_emotions() -> pd.DataFrame:
     merged = cluster_df.merge(emotion_df, on='chapter', how='inner')
 
     # Get emotion columns
-    emotion_cols = ['trust', 'joy', 'anger', 'anticipation',
-                   'fear', 'disgust', 'surprise', 'sadness']
+    emotion_cols = list(EMOTION_ORDER)
 
     # Calculate mean emotion scores per cluster
     cluster_emotions = merged.groupby('cluster')[emotion_cols].mean().reset_index()
 
     return cluster_emotions
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_emotion_scores_by_chapter() -> pd.DataFrame:
+    """
+    Load emotion scores indexed by chapter for per-chapter lookups.
+
+    The 'chapter' column is kept and the index is left unnamed, so
+    column-based merges and filters still work on the result.
+    """
+    return load_emotion_scores().set_index('chapter', drop=False).rename_axis(None)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_stories_by_chapter() -> pd.DataFrame:
+    """Load the stories dataset indexed by chapter (column kept)."""
+    return load_stories().set_index('chapter', drop=False).rename_axis(None)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_cluster_assignments_by_cluster() -> pd.DataFrame:
+    """Load cluster assignments indexed by cluster label (column kept)."""
+    return load_cluster_assignments().set_index('cluster', drop=False).rename_axis(None)
+
+def rows_for(df: pd.DataFrame, key: Any) -> pd.DataFrame:
+    """
+    Rows whose index equals ``key`` (empty frame if absent), via index lookup.
+
+    Meant for the ``*_by_chapter`` / ``*_by_cluster`` frames above.
+    """
+    return df.loc[[key]] if key in df.index else df.iloc[0:0]
+
+@dataclass(frozen=True)
+class EmotionTable:
+    """
+    Per-chapter emotion scores as plain arrays for direct row access.
+
+    Attributes:
+        chapters: Chapter ids (int32), one per matrix row
+        matrix: Scores (float32) with shape (n_chapters, n_emotions)
+        index: Chapter id -> row in ``matrix``
+        emotions: Emotion column names, in matrix column order
+    """
+    chapters: np.ndarray
+    matrix: np.ndarray
+    index: Dict[int, int]
+    emotions: Tuple[str, ...]
+
+    def row(self, chapter: int) -> Optional[Dict[str, float]]:
+        """Emotion name -> score for one chapter (None if it has no row)."""
+        row_idx = self.index.get(chapter)
+        if row_idx is None:
+            return None
+        return dict(zip(self.emotions, self.matrix[row_idx].tolist()))
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Legacy DataFrame view with a 'chapter' column plus one column per emotion."""
+        df = pd.DataFrame(self.matrix, columns=list(self.emotions))
+        df.insert(0, 'chapter', self.chapters)
+        return df
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_emotion_table() -> EmotionTable:
+    """Load the emotion scores once as an EmotionTable (first row per chapter wins)."""
+    df = load_emotion_scores().drop_duplicates('chapter')
+    emotions = tuple(col for col in df.columns if col.lower() in EMOTION_SET)
+    chapters = df['chapter'].to_numpy(dtype=np.int32)
+    return EmotionTable(
+        chapters=chapters,
+        matrix=df[list(emotions)].to_numpy(dtype=np.float32),
+        index={chapter: row for row, chapter in enumerate(chapters.tolist())},
+        emotions=emotions,
+    )
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def compute_overall_emotion_means() -> Dict[str, float]:
+    """
+    Mean score per emotion across all chapters.
+
+    Returns:
+        Dictionary mapping emotion column name to its mean, in column order
+        (empty if no emotion columns are present)
+    """
+    table = get_emotion_table()
+    if not table.emotions or not len(table.chapters):
+        return {}
+    return dict(zip(table.emotions, _emotion_means(table).tolist()))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_overall_emotion_extremes() -> Optional[Tuple[Tuple[str, float], Tuple[str, float]]]:
+    """
+    Highest and lowest mean emotion across all chapters.
+
+    Returns:
+        ((max_name, max_mean), (min_name, min_mean)), or None if no emotion
+        scores are available
+    """
+    table = get_emotion_table()
+    if not table.emotions or not len(table.chapters):
+        return None
+    means = _emotion_means(table)
+    i_max, i_min = int(means.argmax()), int(means.argmin())
+    return (
+        (table.emotions[i_max], float(means[i_max])),
+        (table.emotions[i_min], float(means[i_min])),
+    )
+
+def _emotion_means(table: EmotionTable) -> np.ndarray:
+    """Column means of the emotion matrix, accumulated in float64 for full precision."""
+    return table.matrix.mean(axis=0, dtype=np.float64)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_cluster_options() -> tuple:
+    """Sorted cluster labels from the cluster emotion data (for selectboxes)."""
+    return tuple(sorted(load_cluster_emotions()['cluster'].unique()))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_cluster_assignment_map() -> Dict[int, int]:
+    """
+    Chapter -> cluster label lookup built once from the cluster assignments.
+
+    Returns:
+        Dictionary mapping chapter id to cluster label (empty if the
+        cluster assignments file is missing or lacks either column)
+    """
+    try:
+        df = load_cluster_assignments()
+    except FileNotFoundError:
+        return {}
+    if 'chapter' not in df.columns or 'cluster' not in df.columns:
+        return {}
+    return dict(zip(df['chapter'].tolist(), df['cluster'].tolist()))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_cluster_summary() -> Tuple[pd.Series, tuple]:
+    """
+    Chapter counts and labels for the clusters in the cluster assignments.
+
+    Returns:
+        Tuple of (counts, cluster_ids) where counts is indexed by cluster
+        label in ascending order and cluster_ids lists the same labels
+    """
+    counts = load_cluster_assignments()['cluster'].value_counts().sort_index()
+    return counts, tuple(counts.index)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_chapter_options() -> tuple:
+    """Sorted chapter ids from the emotion scores (for selectboxes)."""
+    return tuple(sorted(load_emotion_scores()['chapter'].unique()))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_available_clusters() -> tuple:
+    """Sorted cluster labels from the cluster assignments (for selectboxes)."""
+    return tuple(sorted(load_cluster_assignments()['cluster'].unique().tolist()))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_available_emotions() -> tuple:
+    """Emotions with word frequencies, in EMOTION_ORDER (for selectboxes)."""
+    word_freq = load_top_words('emotion')
+    if 'emotion' not in word_freq.columns:
+        return ()
+    present = set(word_freq['emotion'].unique())
+    return tuple(e for e in EMOTION_ORDER if e in present)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_story_chapter_options() -> tuple:
+    """Sorted chapter ids from the stories dataset (for selectboxes)."""
+    return tuple(sorted(load_stories()['chapter'].unique().tolist()))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_chapter_title_map() -> Dict[int, str]:
+    """
+    Map chapter id to story title.
+
+    Returns:
+        Dictionary of chapter -> title (empty if the stories have no title column)
+    """
+    stories = load_stories()
+    if 'title' not in stories.columns:
+        return {}
+    return dict(zip(stories['chapter'], stories['title']))
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_overall_emotions() -> pd.DataFrame:
     """Load overall emotion statistics."""
     return load_csv("overall_emotions.csv")
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_text_statistics() -> pd.DataFrame:
     """Load text statistics."""
     return load_csv("text_statistics.csv")
 
+def _as_category(df: pd.DataFrame, *columns: str) -> pd.DataFrame:
+    """
+    Store low-cardinality label columns as pandas ``category`` dtype.
+
+    Equality filters then compare small integer codes instead of Python
+    objects. Columns missing from ``df`` are skipped.
+    """
+    for column in columns:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    return df
+
+def _categorize(tags: pd.Series, categories: Dict[str, str]) -> pd.Series:
+    """Map tags (case-insensitively) to a categorical series of coarse categories."""
+    labels = sorted(set(categories.values())) + ['other']
+    mapped = tags.astype(str).str.strip().str.upper().map(categories).fillna('other')
+    return pd.Categorical(mapped, categories=labels)
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_pos_distribution() -> pd.DataFrame:
-    """Load POS distribution data."""
-    return load_csv("pos_distribution.csv")
+    """
+    Load POS distribution data.
+
+    Adds a categorical ``category`` column ('noun', 'verb' or 'other') so
+    pages can filter with an equality check instead of a regex scan.
+    """
+    df = _as_category(load_csv("pos_distribution.csv"), 'pos_tag')
+    if 'pos_tag' in df.columns:
+        df['category'] = _categorize(df['pos_tag'], POS_CATEGORIES)
+    return df
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_pos_by_chapter() -> pd.DataFrame:
     """Load POS data by chapter."""
-    return load_csv("pos_by_chapter.csv")
+    return _as_category(load_csv("pos_by_chapter.csv"), 'pos_tag')
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_pos_by_cluster() -> pd.DataFrame:
     """Load POS data by cluster."""
-    return load_csv("pos_by_cluster.csv")
+    return _as_category(load_csv("pos_by_cluster.csv"), 'pos_tag')
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_ner_entities() -> pd.DataFrame:
-    """Load NER entities."""
-    return load_csv("ner_entities.csv")
+    """
+    Load NER entities.
+
+    Adds a categorical ``category`` column ('person', 'place', 'org' or
+    'other') derived from ``entity_type``.
+    """
+    df = _as_category(load_csv("ner_entities.csv"), 'entity_type')
+    if 'entity_type' in df.columns:
+        df['category'] = _categorize(df['entity_type'], ENTITY_CATEGORIES)
+    return df
 
+# Entity category -> precomputed top-entity file (process_data/generate_ner_top_entities.py)
+_TOP_ENTITIES_SOURCES = {
+    'person': "ner_top_people.csv",
+    'place': "ner_top_places.csv",
+}
+
+# Number of entities shown per top-entity table
+TOP_ENTITIES_LIMIT = 20
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_top_entities(category: str = 'person') -> pd.DataFrame:
+    """
+    Load the most mentioned entities of one category.
+
+    Args:
+        category: 'person' or 'place'
+
+    Returns:
+        DataFrame with columns: entity, count, sorted by descending count and
+        limited to TOP_ENTITIES_LIMIT rows. Falls back to summing the
+        per-chapter NER entities when the precomputed file is missing or
+        older than ner_entities.csv.
+    """
+    top_file = _TOP_ENTITIES_SOURCES[category]
+    if _fresh_derived_file(top_file, "ner_entities.csv") is not None:
+        return load_csv(top_file)
+
+    df = load_ner_entities()
+    matches = df[df['category'] == category]
+    if 'count' in matches.columns:
+        counts = matches.groupby('entity', sort=False)['count'].sum()
+    else:
+        counts = matches['entity'].value_counts(sort=False)
+    counts = counts.sort_values(ascending=False, kind='stable').head(TOP_ENTITIES_LIMIT)
+    return counts.rename('count').rename_axis('entity').reset_index()
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_ner_by_chapter() -> pd.DataFrame:
     """Load NER data by chapter."""
-    return load_csv("ner_by_chapter.csv")
+    return _as_category(load_csv("ner_by_chapter.csv"), 'entity_type')
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_ner_counts() -> pd.DataFrame:
     """Load NER counts."""
-    return load_csv("ner_counts.csv")
+    return _as_category(load_csv("ner_counts.csv"), 'entity_type')
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_word_frequencies() -> pd.DataFrame:
     """Load word frequencies."""
     return load_csv("word_frequencies.csv")
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_word_freq_by_cluster() -> pd.DataFrame:
     """Load word frequencies by cluster."""
-    return load_csv("word_freq_by_cluster.csv")
+    return _as_category(load_csv("word_freq_by_cluster.csv"), 'cluster')
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_word_freq_by_emotion() -> pd.DataFrame:
     """Load word frequencies by emotion."""
-    return load_csv("word_freq_by_emotion.csv")
+    return _as_category(load_csv("word_freq_by_emotion.csv"), 'emotion')
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_word_freq_by_pos() -> pd.DataFrame:
     """Load word frequencies by POS tag."""
-    return load_csv("word_freq_by_pos.csv")
+    return _as_category(load_csv("word_freq_by_pos.csv"), 'pos_tag')
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_word_freq_by_ner() -> pd.DataFrame:
     """Load word frequencies by NER entity type."""
-    return load_csv("word_freq_by_ner.csv")
+    return _as_category(load_csv("word_freq_by_ner.csv"), 'entity_type')
+
+def _word_index(df: pd.DataFrame, tag_col: str) -> Dict[str, Dict[str, int]]:
+    """Split a word frequency table into {tag: {word: frequency}} in one groupby."""
+    return {
+        str(tag): group.set_index('word')['frequency'].to_dict()
+        for tag, group in df.groupby(tag_col, observed=True, sort=False)
+    }
+
+# The word indexes are shared, read-only lookups: cache_resource hands every
+# caller the same dicts instead of unpickling a copy per call, so callers must
+# not mutate them.
+@st.cache_resource(ttl=3600, show_spinner=False)
+def get_pos_word_index() -> Dict[str, Dict[str, int]]:
+    """Word frequencies by POS tag as {pos_tag: {word: frequency}}."""
+    return _word_index(load_word_freq_by_pos(), 'pos_tag')
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def get_ner_word_index() -> Dict[str, Dict[str, int]]:
+    """Word frequencies by NER entity type as {entity_type: {word: frequency}}."""
+    return _word_index(load_word_freq_by_ner(), 'entity_type')
+
+# Word cloud scope -> (precomputed top-word file, full frequency file, group column).
+# The top-word files are written by process_data/generate_top_words.py.
+_TOP_WORDS_SOURCES = {
+    'overall': ("top_words_overall.csv", "word_frequencies.csv", None),
+    'cluster': ("top_words_by_cluster.csv", "word_freq_by_cluster.csv", 'cluster'),
+    'emotion': ("top_words_by_emotion.csv", "word_freq_by_emotion.csv", 'emotion'),
+}
+
+# Number of words shown per word cloud
+TOP_WORDS_LIMIT = 100
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_top_words(scope: str = 'overall') -> pd.DataFrame:
+    """
+    Load the ranked top-word table for a word cloud scope.
 
+    Args:
+        scope: 'overall', 'cluster' or 'emotion'
+
+    Returns:
+        DataFrame with columns: [group,] word, frequency, sorted by group then
+        descending frequency and limited to TOP_WORDS_LIMIT words per group.
+        Falls back to ranking the full frequency table when the precomputed
+        file is missing or older than it.
+    """
+    top_file, full_file, group_col = _TOP_WORDS_SOURCES[scope]
+    if _fresh_derived_file(top_file, full_file) is not None:
+        df = load_csv(top_file)
+    else:
+        df = _rank_top_words(load_csv(full_file), group_col)
+    return _as_category(df, group_col) if group_col else df
+
+def _rank_top_words(df: pd.DataFrame, group_col: Optional[str]) -> pd.DataFrame:
+    """Top TOP_WORDS_LIMIT words (per group) of a full frequency table."""
+    # A repeated word counts once, with its last frequency (as a {word: freq} dict would)
+    df = df.drop_duplicates([group_col, 'word'] if group_col else 'word', keep='last')
+    if group_col is None:
+        return df.sort_values('frequency', ascending=False, kind='stable').head(TOP_WORDS_LIMIT)
+    df = df.sort_values([group_col, 'frequency'], ascending=[True, False], kind='stable')
+    return df.groupby(group_col, sort=False).head(TOP_WORDS_LIMIT)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_top_words(scope: str = 'overall', group: Any = None) -> Dict[str, int]:
+    """
+    Top words of one word cloud as {word: frequency}, most frequent first.
+
+    Args:
+        scope: 'overall', 'cluster' or 'emotion'
+        group: Cluster label or emotion name (ignored for 'overall')
+
+    Returns:
+        Dictionary of at most TOP_WORDS_LIMIT words (empty for an unknown group)
+    """
+    df = load_top_words(scope)
+    group_col = _TOP_WORDS_SOURCES[scope][2]
+    if group_col is not None:
+        df = df[df[group_col] == group]
+    return df.set_index('word')['frequency'].to_dict()
+
+def get_prebuilt_wordcloud(scope: str = 'overall', group: Any = None,
+                           theme: str = "light") -> Optional[Path]:
+    """
+    Prerendered PNG of an unfiltered word cloud, if one is up to date.
+
+    Args:
+        scope: 'overall', 'cluster' or 'emotion'
+        group: Cluster label or emotion name (ignored for 'overall')
+        theme: Word cloud theme ("light" or "dark")
+
+    Returns:
+        Path to the PNG, or None if it is missing or older than the word
+        frequency file it would be built from (see load_top_words)
+    """
+    top_file, full_file, _ = _TOP_WORDS_SOURCES[scope]
+    source = _fresh_derived_file(top_file, full_file) or get_data_path(full_file)
+    if not source.exists():
+        return None
+
+    image = get_wordcloud_path(source.parent, scope, group, theme)
+    if image.exists() and image.stat().st_mtime >= source.stat().st_mtime:
+        return image
+    return None
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_emotion_words_found() -> pd.DataFrame:
     """Load emotion words found in text."""
-    return load_csv("emotion_words_found.csv")
+    return _as_category(load_csv("emotion_words_found.csv"), 'emotion')
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_chapter_similarity() -> pd.DataFrame:
     """Load chapter similarity matrix."""
     return load_csv("chapter_similarity.csv")
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_top_k_similar(k: int = 5) -> Dict[int, List[Tuple[int, float]]]:
+    """
+    Top-k most similar chapters for every chapter, built once from the
+    similarity table.
+
+    Args:
+        k: Number of neighbours to keep per chapter
+
+    Returns:
+        Dictionary mapping chapter id to a list of (similar_chapter, similarity)
+        pairs, highest similarity first (empty if the table lacks the
+        expected columns)
+    """
+    df = load_chapter_similarity()
+    similar_col = 'similar_chapter' if 'similar_chapter' in df.columns else 'chapter_2'
+    if not {'chapter', similar_col, 'similarity'}.issubset(df.columns):
+        return {}
+
+    top = (
+        df.sort_values(['chapter', 'similarity'], ascending=[True, False], kind='stable')
+        .groupby('chapter', sort=False)
+        .head(k)
+    )
+    result: Dict[int, List[Tuple[int, float]]] = {}
+    for chapter, similar, score in zip(
+        top['chapter'].tolist(), top[similar_col].tolist(), top['similarity'].tolist()
+    ):
+        result.setdefault(chapter, []).append((similar, score))
+    return result
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_cluster_visualization() -> pd.DataFrame:
     """
     Load cluster visualization data (2D coordinates) from wangchan_cluster.csv.
@@ -194,8 +647,9 @@ def load_cluster_visualization() -> pd.DataFrame:
     """
     return load_cluster_assignments()
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def get_dataset_stats() -> Dict[str, Any]:
-    """Get overall dataset statistics."""
+    """Get overall dataset statistics (cached across reruns)."""
     try:
         stories = load_stories()
         text_stats = load_text_statistics()
@@ -217,8 +671,8 @@ def get_dataset_stats() -> Dict[str, Any]:
     except Exception as e:
         # Return defaults if data not available
         return {
-            'total_stories': 300,
-            'total_chapters': 313,
+            'total_stories': 314,
+            'total_chapters': 314,
             'total_words': 0,
             'avg_words_per_chapter': 0,
             'language': 'Thai'
@@ -6,6 +6,8 @@ which are probability distributions that often cluster tightly around 0.125 (1/8
 
 from typing import Dict, Tuple
 
+import numpy as np
+
 
 # Baseline for uniform distribution across 8 emotions
 UNIFORM_BASELINE = 0.125
@@ -22,6 +24,26 @@ GLOBAL_EMOTION_MAX = 0.177014  # Maximum score observed (trust in chapter 64)
 # Recommended values: 0.3-0.7 for highlighting top emotions
 MINMAX_SCALING_STRENGTH = 1  # Adjust this value to control peak prominence
 
+# UI descriptions for each scaling method
+SCALING_DESCRIPTIONS = {
+    'minmax': (
+        "**Highlight Differences (Min-Max)**: Scales emotions using global min/max "
+        "values across all 314 chapters (0.104-0.177). Scores close to 1.0 indicate "
+        "emotions near the dataset maximum, while scores near 0.0 are near the minimum. "
+        "Provides consistent comparison across all stories."
+    ),
+    'baseline': (
+        "**Above/Below Baseline**: Shows how much each emotion deviates from "
+        "uniform distribution (12.5%). Values near 0.5 are close to baseline, "
+        "1.0 means highly over-represented, 0.0 means highly under-represented."
+    ),
+    'raw': (
+        "**Raw Scores**: Original probability scores as predicted by the model. "
+        "All emotions sum to 1.0 (100%). Small visual differences due to tight "
+        "clustering around 0.125 (12.5%)."
+    )
+}
+
 
 def scale_emotion_scores(
     emotion_scores: Dict[str, float],
@@ -46,53 +68,60 @@ def scale_emotion_scores(
     # Keep raw scores for reference
     raw_scores = emotion_scores.copy()
 
-    if method == 'raw':
+    if method not in ('minmax', 'baseline'):
+        # 'raw', or default to raw if unknown method
         return raw_scores, raw_scores
 
-    elif method == 'minmax':
-        # Global min-max normalization: scale using global min/max across ALL chapters
-        # This ensures consistent scaling - only the true global extremes get 0.0 or 1.0
+    scaled_values = scale_emotion_array(
+        np.fromiter(emotion_scores.values(), dtype=np.float64, count=len(emotion_scores)),
+        method
+    )
+    scaled = dict(zip(emotion_scores.keys(), scaled_values.tolist()))
+
+    return scaled, raw_scores
 
-        # Step 1: Normalize to 0-1 range using global min/max
-        normalized = {
-            emotion: (score - GLOBAL_EMOTION_MIN) / (GLOBAL_EMOTION_MAX - GLOBAL_EMOTION_MIN)
-            for emotion, score in emotion_scores.items()
-        }
 
-        # Step 2: Apply power transformation to adjust peak prominence
-        # Values < 1.0 make high values higher and low values lower (more separation)
-        # Values > 1.0 compress the differences
-        scaled = {
-            emotion: max(0.0, min(1.0, value ** MINMAX_SCALING_STRENGTH))
-            for emotion, value in normalized.items()
-        }
+def scale_emotion_array(scores: np.ndarray, method: str = 'minmax') -> np.ndarray:
+    """
+    Vectorized scaling kernel behind scale_emotion_scores.
+
+    Works element-wise on an array of any shape, so a whole
+    (chapters x emotions) matrix can be scaled in one call.
+
+    Args:
+        scores: Array of raw emotion scores
+        method: 'minmax', 'baseline' or 'raw' (unknown methods return a copy)
 
-        return scaled, raw_scores
+    Returns:
+        Array of scaled scores with the same shape as ``scores``
+    """
+    scores = np.asarray(scores, dtype=np.float64)
 
-    elif method == 'baseline':
+    if method == 'minmax':
+        # Global min-max normalization: scale using global min/max across ALL chapters
+        # This ensures consistent scaling - only the true global extremes get 0.0 or 1.0
+        normalized = (scores - GLOBAL_EMOTION_MIN) / (GLOBAL_EMOTION_MAX - GLOBAL_EMOTION_MIN)
+
+        # Clip to 0-1 first, then apply the power transformation to adjust peak
+        # prominence (values < 1.0 give more separation, > 1.0 compress it)
+        return np.clip(normalized, 0.0, 1.0) ** MINMAX_SCALING_STRENGTH
+
+    if method == 'baseline':
         # Show percentage above/below uniform distribution
-        # Normalize to 0-1 range for visualization
         # Max observed score is ~0.177, min is ~0.104
         # Range from baseline: -0.021 to +0.052
-
         max_deviation = 0.052  # Maximum observed deviation above baseline
+        deviation = scores - UNIFORM_BASELINE
+
+        # Above baseline: 0 = at baseline, 1 = maximum above baseline
+        # Below baseline: map to 0-0.5 range (minimum observed is -0.021)
+        return np.where(
+            deviation >= 0,
+            np.minimum(1.0, deviation / max_deviation),
+            np.maximum(0.0, 0.5 + (deviation / 0.021) * 0.5)
+        )
 
-        scaled = {}
-        for emotion, score in emotion_scores.items():
-            deviation = score - UNIFORM_BASELINE
-            # Normalize: 0 = at baseline, 1 = maximum above baseline
-            if deviation >= 0:
-                scaled[emotion] = min(1.0, deviation / max_deviation)
-            else:
-                # Below baseline: map to 0-0.5 range
-                # Minimum observed is -0.021 below baseline
-                scaled[emotion] = max(0.0, 0.5 + (deviation / 0.021) * 0.5)
-
-        return scaled, raw_scores
-
-    else:
-        # Default to raw if unknown method
-        return raw_scores, raw_scores
+    return scores.copy()
 
 
 def get_scaling_description(method: str) -> str:
@@ -105,25 +134,7 @@ def get_scaling_description(method: str) -> str:
     Returns:
         Description string for UI display
     """
-    descriptions = {
-        'minmax': (
-            "**Highlight Differences (Min-Max)**: Scales emotions using global min/max "
-            "values across all 314 chapters (0.104-0.177). Scores close to 1.0 indicate "
-            "emotions near the dataset maximum, while scores near 0.0 are near the minimum. "
-            "Provides consistent comparison across all stories."
-        ),
-        'baseline': (
-            "**Above/Below Baseline**: Shows how much each emotion deviates from "
-            "uniform distribution (12.5%). Values near 0.5 are close to baseline, "
-            "1.0 means highly over-represented, 0.0 means highly under-represented."
-        ),
-        'raw': (
-            "**Raw Scores**: Original probability scores as predicted by the model. "
-            "All emotions sum to 1.0 (100%). Small visual differences due to tight "
-            "clustering around 0.125 (12.5%)."
-        )
-    }
-    return descriptions.get(method, "Unknown scaling method")
+    return SCALING_DESCRIPTIONS.get(method, "Unknown scaling method")
 
 
 def format_score_display(
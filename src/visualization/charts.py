@@ -4,27 +4,9 @@ import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 from typing import List, Optional, Dict
-import sys
-from pathlib import Path
-
-# Add src to path for importing utilities
-src_path = Path(__file__).parent.parent
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
-
+from utils.config import EMOTIONS
 from utils.emotion_scaling import scale_emotion_scores, format_score_display
 
-EMOTIONS = [
-    "trust",
-    "joy",
-    "anger",
-    "anticipation",
-    "fear",
-    "disgust",
-    "surprise",
-    "sadness"
-]
-
 def create_emotion_bar_chart(
     emotion_data: Dict[str, float],
     title: str = "Emotion Distribution",
@@ -61,9 +61,9 @@ def create_cluster_scatter_plot(
     
     hover_text = None
     if hover_data:
-        hover_text = ["<br>".join([str(h[i]) for h in hover_data]) for i in range(len(df))]
+        hover_text = ["<br>".join(map(str, values)) for values in zip(*hover_data)]
     
-    # Create scatter plot
+    # Create scatter plot (WebGL traces, which stay fast as the point count grows)
     if cluster_col in df.columns:
         # Color by cluster
         fig = px.scatter(
@@ -75,12 +75,13 @@ def create_cluster_scatter_plot(
             hover_data={cluster_col: True},
             title=title,
             labels={x_col: "Dimension 1", y_col: "Dimension 2", cluster_col: "Cluster"},
-            color_discrete_sequence=px.colors.qualitative.Set3
+            color_discrete_sequence=px.colors.qualitative.Set3,
+            render_mode='webgl'
         )
     else:
         # Single color
         fig = go.Figure()
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=df[x_col],
             y=df[y_col],
             mode='markers',
@@ -99,7 +100,9 @@ def create_cluster_scatter_plot(
         font=dict(color=text_color),
         xaxis=dict(gridcolor=grid_color, color=text_color),
         yaxis=dict(gridcolor=grid_color, color=text_color),
-        title=dict(font=dict(color=text_color))
+        title=dict(font=dict(color=text_color)),
+        # Keep the user's pan/zoom across Streamlit reruns
+        uirevision='clusters'
     )
 
     return fig
@@ -4,13 +4,6 @@ import plotly.graph_objects as go
 import pandas as pd
 from typing import Dict, List, Optional
 
-# Import scaling utilities
-import sys
-from pathlib import Path
-src_path = Path(__file__).parent.parent
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
-
 from utils.emotion_scaling import scale_emotion_scores, format_score_display
 
 EMOTIONS = [
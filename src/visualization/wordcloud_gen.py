@@ -8,7 +8,6 @@ from wordcloud import WordCloud
 from typing import Dict, Optional
 from pathlib import Path
 import io
-import base64
 import logging
 import numpy as np
 from PIL import Image
@@ -96,7 +95,7 @@ def generate_wordcloud(
     max_words: int = 500,
     theme: str = "light",
     title: Optional[str] = None
-) -> str:
+) -> bytes:
     """
     Generate a word cloud image with Buddha mask and custom colors.
 
@@ -109,7 +108,7 @@ def generate_wordcloud(
         title: Optional title text to display in top-right corner
 
     Returns:
-        Base64 encoded image string
+        PNG image bytes
     """
     if not word_freq:
         # Return empty image
@@ -122,8 +121,7 @@ def generate_wordcloud(
         buf = io.BytesIO()
         plt.savefig(buf, format='png', bbox_inches='tight')
         plt.close()
-        buf.seek(0)
-        return base64.b64encode(buf.read()).decode()
+        return buf.getvalue()
 
     # Get project root and paths
     project_root = Path(__file__).parent.parent.parent
@@ -195,11 +193,9 @@ def generate_wordcloud(
     plt.tight_layout(pad=0)
     plt.savefig(buf, format='png', bbox_inches='tight', dpi=200, facecolor=facecolor)
     plt.close()
-    buf.seek(0)
+    return buf.getvalue()
 
-    return base64.b64encode(buf.read()).decode()
-
-def wordcloud_from_dict(word_freq: Dict[str, int]) -> str:
+def wordcloud_from_dict(word_freq: Dict[str, int]) -> bytes:
     """Convenience function to generate word cloud from dictionary."""
     return generate_wordcloud(word_freq)
 
@@ -213,11 +209,11 @@ def wordcloud_from_dataframe(df, word_col: str = 'word', freq_col: str = 'freque
         freq_col: Name of frequency column
     
     Returns:
-        Base64 encoded image string
+        PNG image bytes
     """
     if word_col not in df.columns or freq_col not in df.columns:
         return generate_wordcloud({})
     
-    word_freq = dict(zip(df[word_col], df[freq_col]))
+    word_freq = df.set_index(word_col)[freq_col].to_dict()
     return generate_wordcloud(word_freq)
 